@@ -0,0 +1,124 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from .data_loader import DataLoader
+
+
+def _load_in_worker(method, cache_dir, cache_max_bytes, args, kwargs):
+    """
+    Runs one DataLoader load method on a fresh loader, in an executor thread or process.
+    """
+    loader = DataLoader(cache_dir, cache_max_bytes) if cache_dir is not None else DataLoader()
+    return getattr(loader, method)(*args, **kwargs)
+
+
+class AsyncDataLoader:
+    """
+    An asyncio front end to DataLoader.
+
+    Parsing runs in an executor, so awaiting a load never blocks the event
+    loop, and several loads can run concurrently. Loaded datasets given a
+    name are registered in the wrapped DataLoader.
+    """
+
+    def __init__(self, loader=None, executor=None, max_workers=None):
+        """
+        Parameters:
+            - loader (DataLoader): Loader whose cache settings and registry are used (default: None, a new DataLoader).
+            - executor (concurrent.futures.Executor): Executor running the parses; a ProcessPoolExecutor
+              sidesteps the GIL for CPU-bound parsing. It stays owned by the caller and is not shut down
+              by close (default: None, a ThreadPoolExecutor).
+            - max_workers (int): Workers of the default executor (default: None).
+        """
+        self.loader = loader if loader is not None else DataLoader()
+        self.owns_executor = executor is None  # only an executor created here is shut down by close
+        self.executor = executor if executor is not None else ThreadPoolExecutor(max_workers)
+
+    async def _run(self, method, *args, name=None, **kwargs):
+        cache = self.loader.cache
+        call = functools.partial(_load_in_worker, method, cache and cache.cache_dir, cache and cache.max_bytes,
+                                 args, kwargs)
+        data = await asyncio.get_running_loop().run_in_executor(self.executor, call)
+        if name is not None:
+            self.loader.add_data(name, data)
+        return data
+
+    async def load_csv(self, filepath, **kwargs):
+        """
+        Awaitable DataLoader.load_csv, with the same parameters.
+        """
+        return await self._run('load_csv', filepath, **kwargs)
+
+    async def load_excel(self, filepath, **kwargs):
+        """
+        Awaitable DataLoader.load_excel, with the same parameters.
+        """
+        return await self._run('load_excel', filepath, **kwargs)
+
+    async def load_jsonl(self, filepath, **kwargs):
+        """
+        Awaitable DataLoader.load_jsonl, with the same parameters.
+        """
+        return await self._run('load_jsonl', filepath, **kwargs)
+
+    async def load_sql(self, connection, query, **kwargs):
+        """
+        Awaitable DataLoader.load_sql, with the same parameters. A str connection
+        is opened in the worker; a connection object has to be usable from it.
+        """
+        return await self._run('load_sql', connection, query, **kwargs)
+
+    async def load_parquet(self, filepath, **kwargs):
+        """
+        Awaitable DataLoader.load_parquet, with the same parameters.
+        """
+        return await self._run('load_parquet', filepath, **kwargs)
+
+    async def load_feather(self, filepath, **kwargs):
+        """
+        Awaitable DataLoader.load_feather, with the same parameters.
+        """
+        return await self._run('load_feather', filepath, **kwargs)
+
+    async def load_many(self, filepaths, method='load_csv', **kwargs):
+        """
+        Loads several files concurrently with the same parameters.
+
+        Parameters:
+            - filepaths (list): Paths of the files.
+            - method (str): Name of the DataLoader load method (default: 'load_csv').
+
+        Returns:
+            - list: Loaded datasets, in the order of filepaths.
+        """
+        return await asyncio.gather(*(self._run(method, path, **kwargs) for path in filepaths))
+
+    def prefetch(self, filepath, method='load_csv', **kwargs):
+        """
+        Starts loading a file in the background right away.
+
+        Returns:
+            - asyncio.Task: Task resolving to the loaded dataset.
+        """
+        return asyncio.ensure_future(self._run(method, filepath, **kwargs))
+
+    def close(self):
+        """
+        Shuts the executor created by this loader down, waiting for running loads.
+        Blocks, so from a coroutine use aclose instead.
+        """
+        if self.owns_executor:
+            self.executor.shutdown(wait=True)
+
+    async def aclose(self):
+        """
+        Awaitable close: waits for running loads without blocking the event loop.
+        """
+        if self.owns_executor:
+            await asyncio.to_thread(self.executor.shutdown, wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
@@ -0,0 +1,145 @@
+import hashlib
+import os
+import warnings
+import pandas as pd
+
+DEFAULT_CACHE_BYTES = 10 * 1024 ** 3  # 10 GB cap on the total size of the cache directory
+CACHE_SUFFIX = '.parquet'
+
+
+class ParseCache:
+    """
+    A persistent on-disk cache of parsed datasets stored as Parquet files.
+
+    Entries are keyed by the absolute path, mtime and size of the source file
+    plus the options it was parsed with, so a modified file or a different
+    set of arguments is a cache miss. Once the directory grows past max_bytes
+    the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_CACHE_BYTES):
+        """
+        Parameters:
+            - cache_dir (str): Directory holding the cached files, created if missing.
+            - max_bytes (int): Size cap of the cache directory in bytes (default: 10 GB).
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes should be a positive integer.")
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _digest(text):
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:32]
+
+    def _source_prefix(self, filepath):
+        """
+        Returns the part of the entry name shared by every entry of one source file.
+        """
+        return self._digest(os.path.abspath(filepath)) + '-'
+
+    def entry_path(self, filepath, options):
+        """
+        Returns the cache file for a source file parsed with the given options.
+
+        Parameters:
+            - filepath (str): Path to the source file.
+            - options (dict): Arguments the file is parsed with.
+
+        Returns:
+            - str: Path of the cache entry (which may not exist yet).
+        """
+        st = os.stat(filepath)
+        signature = repr((st.st_mtime_ns, st.st_size, sorted(options.items())))
+        name = self._source_prefix(filepath) + self._digest(signature) + CACHE_SUFFIX
+        return os.path.join(self.cache_dir, name)
+
+    def get(self, filepath, options):
+        """
+        Loads a cached parse of filepath.
+
+        Returns:
+            - pd.DataFrame: Cached dataset, or None on a cache miss.
+        """
+        path = self.entry_path(filepath, options)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            data = pd.read_parquet(path)
+        except Exception as e:  # unreadable entry, drop it and parse again
+            warnings.warn(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        os.utime(path)  # mark as recently used for LRU eviction
+        return data
+
+    def put(self, filepath, options, data):
+        """
+        Writes a parsed dataset to the cache and evicts old entries if needed.
+
+        Datasets that cannot be stored as Parquet (e.g. mixed-type object
+        columns) are skipped with a warning instead of failing the load.
+        """
+        path = self.entry_path(filepath, options)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            data.to_parquet(tmp_path)
+            os.replace(tmp_path, path)  # atomic, readers never see a partial file
+        except Exception as e:
+            warnings.warn(f"Dataset not cached: {e}")
+            self._remove(tmp_path)
+            return
+
+        self._evict()
+
+    def invalidate(self, filepath=None):
+        """
+        Removes cache entries.
+
+        Parameters:
+            - filepath (str): Source file whose entries are removed (default: None, removes all entries).
+        """
+        prefix = None if filepath is None else self._source_prefix(filepath)
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(CACHE_SUFFIX) and (prefix is None or name.startswith(prefix)):
+                self._remove(os.path.join(self.cache_dir, name))
+
+    def size(self):
+        """
+        Returns the total size of the cache entries in bytes.
+        """
+        return sum(st.st_size for _, st in self._entries())
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(CACHE_SUFFIX):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    entries.append((path, os.stat(path)))
+                except FileNotFoundError:  # removed by another process
+                    continue
+        return entries
+
+    def _evict(self):
+        """
+        Removes least recently used entries until the cache fits in max_bytes.
+        """
+        entries = sorted(self._entries(), key=lambda e: e[1].st_mtime)
+        total = sum(st.st_size for _, st in entries)
+        for path, st in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= st.st_size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
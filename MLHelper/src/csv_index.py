@@ -0,0 +1,123 @@
+import os
+import numpy as np
+
+INDEX_SUFFIX = '.idx.npz'
+INDEX_BLOCK = 16 * 1024 * 1024  # bytes scanned per step while building an index
+INDEX_VERSION = 2  # part of the signature, sidecars of older layouts are rebuilt
+
+
+class CsvIndex:
+    """
+    A sidecar index of the byte offset of every record in a CSV file.
+
+    The index is built with one vectorized pass over the file and saved next
+    to it as '<file>.idx.npz'. It is rebuilt automatically when the file's
+    size or mtime change. Newlines inside quoted fields are not treated as
+    record ends, and blank lines are not records, as in pd.read_csv: each
+    one is attached to the byte range of the record before it.
+    """
+
+    def __init__(self, filepath, header=True, quotechar='"'):
+        """
+        Parameters:
+            - filepath (str): Path to the CSV file.
+            - header (bool): Whether the first record is a header row (default: True).
+            - quotechar (str): Quote character, None when fields never contain newlines (default: '"').
+        """
+        self.filepath = filepath
+        self.header = header
+        self.quotechar = quotechar
+        self.index_path = filepath + INDEX_SUFFIX
+        self.signature = self._signature()
+        self.offsets = self._load() if self._is_fresh() else self._build()
+
+    def __len__(self):
+        """
+        Returns the number of data rows (the header excluded).
+        """
+        return len(self.offsets) - 1
+
+    def byte_range(self, start, stop):
+        """
+        Returns the (begin, end) byte offsets of rows start to stop-1.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+        return int(self.offsets[start]), int(self.offsets[stop])
+
+    def signature_changed(self):
+        """
+        Returns True when the file changed since the index was built.
+        """
+        return not np.array_equal(self.signature, self._signature())
+
+    def _signature(self):
+        st = os.stat(self.filepath)
+        return np.array([st.st_size, st.st_mtime_ns, int(self.header), INDEX_VERSION], dtype=np.int64)
+
+    def _is_fresh(self):
+        if not os.path.exists(self.index_path):
+            return False
+        try:
+            with np.load(self.index_path) as saved:
+                return np.array_equal(saved['signature'], self.signature)
+        except Exception:  # corrupt or foreign file, rebuild it
+            return False
+
+    def _load(self):
+        with np.load(self.index_path) as saved:
+            return saved['offsets']
+
+    def _build(self):
+        """
+        Scans the file for newlines outside quoted fields and saves the offsets.
+        """
+        quote = ord(self.quotechar) if self.quotechar else None
+        parts, position, quotes = [np.zeros(1, dtype=np.int64)], 0, 0
+
+        with open(self.filepath, 'rb') as f:
+            while True:
+                block = f.read(INDEX_BLOCK)
+                if not block:
+                    break
+                buffer = np.frombuffer(block, dtype=np.uint8)
+                ends = buffer == ord('\n')
+                if quote is not None:
+                    parity = (np.cumsum(buffer == quote, dtype=np.int64) + quotes) % 2
+                    quotes = int(parity[-1])
+                    ends &= parity == 0
+                parts.append(np.flatnonzero(ends).astype(np.int64) + position + 1)
+                position += len(block)
+
+        offsets = np.concatenate(parts)
+        if offsets[-1] != position:  # last record without a trailing newline
+            offsets = np.append(offsets, position)
+        offsets = self._drop_blank(offsets)
+        if self.header and len(offsets) > 1:
+            offsets = offsets[1:]
+
+        try:
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp.npz"
+            np.savez(tmp_path, offsets=offsets, signature=self.signature)
+            os.replace(tmp_path, self.index_path)
+        except OSError:  # read-only location, keep the index in memory only
+            pass
+        return offsets
+
+    def _drop_blank(self, offsets):
+        """
+        Removes the starts of blank records ('\n' or '\r\n' alone), keeping the final end offset.
+        """
+        lengths = np.diff(offsets)
+        candidates = np.flatnonzero((lengths == 1) | (lengths == 2))
+        if len(candidates) == 0:
+            return offsets
+
+        content = np.memmap(self.filepath, dtype=np.uint8, mode='r')
+        starts = offsets[candidates]
+        first = content[starts]
+        blank = np.where(lengths[candidates] == 1, first == ord('\n'),
+                         (first == ord('\r')) & (content[np.minimum(starts + 1, len(content) - 1)] == ord('\n')))
+        keep = np.ones(len(offsets), dtype=bool)
+        keep[candidates[blank]] = False
+        return offsets[keep]
@@ -1,77 +1,1443 @@
+import bz2
+import glob
+import gzip
+import hashlib
+import io
+import itertools
+import lzma
+import os
+import sqlite3
+import numpy as np
 import pandas as pd
+from .cache import DEFAULT_CACHE_BYTES, ParseCache
+from .csv_index import CsvIndex
+from .dtypes import (SAMPLE_ROWS, categorical_candidates, concat_frames, downcast_frame, guess_date_format,
+                     infer_schema, memory_report, merge_dtypes, schema_kwargs)
+from .mmap_store import read_store, write_store
+from .parallel import default_workers, ordered_map
+from .prefetch import PrefetchIterator
+from .registry import DatasetRegistry
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024  # target size of a streamed chunk when no row count is given
+SAMPLE_BYTES = 64 * 1024  # bytes read from the head of a file to estimate the average row size
+READ_BLOCK = 1024 * 1024  # block size for raw scans over a file
+EXCEL_CHUNK_ROWS = 10000  # rows per chunk when streaming an Excel sheet
+SQL_CHUNK_ROWS = 10000  # rows fetched from the cursor per chunk when streaming a query
+SPARSE_CHUNK_CELLS = 16 * 1024 * 1024  # dense cells parsed at a time while building a sparse matrix
+SPARSE_FORMATS = ('csr', 'csc', 'pandas')
+CSV_SUFFIXES = ('.csv', '.csv.gz', '.csv.bz2', '.csv.zst', '.csv.xz')
+JSONL_SUFFIXES = ('.jsonl', '.jsonl.gz', '.jsonl.bz2', '.jsonl.zst', '.jsonl.xz',
+                  '.ndjson', '.ndjson.gz', '.ndjson.bz2', '.ndjson.zst', '.ndjson.xz')
+SAMPLE_KEY = '__sample_key__'  # temporary column holding the random key of each row while sampling
+
+
+def _import_pyarrow():
+    """
+    Imports the optional pyarrow modules used by the columnar loaders.
+    """
+    try:
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required for Parquet / Arrow support. Install it with 'pip install pyarrow'.")
+    return ds, pq
+
+
+def _import_scipy_sparse():
+    """
+    Imports the optional scipy.sparse module used by the sparse loader.
+    """
+    try:
+        import scipy.sparse as sp
+    except ImportError:
+        raise ImportError("scipy is required for sparse matrix support. Install it with 'pip install scipy'.")
+    return sp
+
+
+def _is_compressed(filepath):
+    return not filepath.endswith('.csv')
+
+
+def _open_binary(filepath):
+    """
+    Opens a (possibly compressed) file for reading, decompressing it as a stream.
+    """
+    if filepath.endswith('.gz'):
+        return gzip.open(filepath, 'rb')
+    if filepath.endswith('.bz2'):
+        return bz2.open(filepath, 'rb')
+    if filepath.endswith('.xz'):
+        return lzma.open(filepath, 'rb')
+    if filepath.endswith('.zst'):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstandard is required for .zst files. Install it with 'pip install zstandard'.")
+        return zstandard.ZstdDecompressor().stream_reader(open(filepath, 'rb'), closefd=True)
+    return open(filepath, 'rb')
+
+
+def _iter_record_blocks(f, chunk_bytes, quotechar):
+    """
+    Reads a stream in blocks of about chunk_bytes that end on a record boundary.
+
+    A newline ends a record only when the quotes before it in the block are
+    balanced; blocks always start on a record boundary, so the count starts
+    at zero in each block.
+    """
+    carry = b''
+    while True:
+        block = f.read(chunk_bytes)
+        if not block:
+            if carry:
+                yield carry
+            return
+        data = carry + block
+        end = data.rfind(b'\n')
+        if quotechar and end != -1:
+            quotes = data.count(quotechar, 0, end)
+            while end != -1 and quotes % 2 == 1:  # newline inside a quoted field, step back
+                previous = data.rfind(b'\n', 0, end)
+                quotes -= data.count(quotechar, previous + 1, end)
+                end = previous
+        if end == -1:
+            carry = data
+        else:
+            carry = data[end + 1:]
+            yield data[:end + 1]
+
+
+def _filter_rows(data, where):
+    """
+    Keeps the rows of data matching where, a DataFrame.query expression or a
+    callable returning a boolean mask.
+    """
+    if where is None:
+        return data
+    if isinstance(where, str):
+        return data.query(where)
+    return data[where(data)]
+
+
+def _read_csv_bytes(payload, kwargs, where=None):
+    """
+    Parses raw CSV records (without header) in a worker process.
+    """
+    return _filter_rows(pd.read_csv(io.BytesIO(payload), header=None, **kwargs), where)
+
+
+def _import_openpyxl():
+    """
+    Imports the optional openpyxl module used to stream Excel sheets.
+    """
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("openpyxl is required for Excel support. Install it with 'pip install openpyxl'.")
+    return openpyxl
+
+
+def _read_excel_sheet(filepath, sheet_name, kwargs):
+    """
+    Parses one sheet of an Excel file in a worker process.
+    """
+    return pd.read_excel(filepath, sheet_name=sheet_name, **kwargs)
+
+
+def _read_csv_file(filepath, kwargs):
+    """
+    Parses one CSV file in a worker process.
+    """
+    return pd.read_csv(filepath, **kwargs)
+
+
+def _count_quotes(filepath, start, end, quotechar):
+    """
+    Counts the quote characters in a byte range of a file, in a worker process.
+    """
+    count = 0
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(READ_BLOCK, remaining))
+            if not block:
+                break
+            count += block.count(quotechar)
+            remaining -= len(block)
+    return count
+
+
+def _next_record_start(f, offset, in_quotes, quotechar):
+    """
+    Returns the offset just after the first newline at or after offset that is
+    not inside a quoted field, or the end of the file.
+
+    Parameters:
+        - f (file): File opened in binary mode.
+        - offset (int): Position to search from.
+        - in_quotes (bool): Whether offset lies inside a quoted field.
+        - quotechar (bytes): Quote character, None when fields never contain newlines.
+    """
+    f.seek(offset)
+    while True:
+        block = f.read(READ_BLOCK)
+        if not block:
+            return offset
+        i = 0
+        while True:
+            newline = block.find(b'\n', i)
+            quote = block.find(quotechar, i) if quotechar else -1
+            if newline == -1 and quote == -1:
+                break
+            if newline != -1 and (quote == -1 or newline < quote):
+                if not in_quotes:
+                    return offset + newline + 1
+                i = newline + 1
+            else:
+                in_quotes = not in_quotes  # an escaped quote ("") toggles twice
+                i = quote + 1
+        offset += len(block)
+
+
+def _read_csv_range(filepath, start, end, kwargs, where=None):
+    """
+    Parses the records in a byte range of a CSV file, in a worker process.
+    """
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        payload = f.read(end - start)
+    return _read_csv_bytes(payload, kwargs, where)
+
 
 class DataLoader:
     """A class to load and manage datasets."""
 
-    def __init__(self):
+    def __init__(self, cache_dir=None, cache_max_bytes=DEFAULT_CACHE_BYTES, memory_budget=None, spill_dir=None):
+        """
+        Parameters:
+            - cache_dir (str): Directory for the parse-once cache of load_csv and load_excel (default: None, no caching).
+            - cache_max_bytes (int): Size cap of the cache, least recently used entries are evicted beyond it (default: 10 GB).
+            - memory_budget (int): Bytes of named datasets kept in memory, least recently used ones are
+              spilled to disk beyond it (default: None, unlimited).
+            - spill_dir (str): Directory for spilled datasets (default: None, a temporary directory).
+        """
+        self.registry = DatasetRegistry(memory_budget, spill_dir)
         self.data = None
+        self.current = None  # name of the dataset self.data refers to, None for an unnamed one
+        self.memory_report = None
+        self.sparse_labels = None  # (row index, column names) of the last matrix returned by load_sparse_csv
+        self.indexes = {}
+        self.schemas = {}  # header signature -> schema inferred by infer_schema
+        self.date_formats = {}  # (header signature, column) -> format detected by detect_date_formats
+        self.cache = ParseCache(cache_dir, cache_max_bytes) if cache_dir is not None else None
 
-    def load_csv(self, filepath, sep=',', usecols=None, names=None, index_col=None, dtype=None):
+    def load_csv(self, filepath, sep=',', usecols=None, names=None, index_col=None, dtype=None, optimize_memory=False,
+                 workers=None, chunk_bytes=None, quoted_newlines=True, where=None, schema=None, parse_dates=None,
+                 name=None):
         """
         Loads a CSV file into a Pandas DataFrame.
 
         Parameters:
-            - filepath (str): Path to the CSV file.
+            - filepath (str): Path to the CSV file, optionally compressed (.csv.gz, .csv.bz2, .csv.zst, .csv.xz).
             - sep (str): Delimiter (default: ',').
             - usecols (list): Columns to load (default: None, loads all).
             - names (list): Column names (default: None).
             - index_col (int/str): Column to use as index (default: None).
             - dtype (dict): Data types for columns (default: None).
+            - optimize_memory (bool): Parse low-cardinality strings as 'category' and narrow numeric
+              columns losslessly, storing a per column report in self.memory_report, which is None
+              when the dataset comes from the cache (default: False).
+            - workers (int): Parse byte ranges of the file in this many processes (default: None, single process).
+            - chunk_bytes (int): Size of a byte range for parallel parsing, or of a chunk when filtering (default: None, 64 MB).
+            - quoted_newlines (bool): Whether quoted fields may contain newlines. Range boundaries are then
+              aligned with an extra parallel pass counting quotes; set to False to skip it (default: True).
+            - where (str/callable): Row filter applied to each chunk as it is parsed, either a DataFrame.query
+              expression such as "region == 'EU'" or a function returning a boolean mask; rows failing it are
+              never kept, so peak memory follows the matching rows. With workers the function must be picklable
+              (default: None, keeps all rows).
+            - schema (dict/str): Schema from infer_schema, or 'auto' to infer (or reuse) one for this file's
+              header; dtypes and date formats are then given to pandas instead of being inferred (default: None).
+            - parse_dates (list): Columns to parse as datetimes. Their format is detected once from a sample
+              (and cached per layout), so pandas parses them with a fixed format (default: None).
+            - name (str): Register the dataset under this name, see get_data (default: None).
 
         Returns:
             - pd.DataFrame: Loaded dataset.
         """
-        if not filepath.endswith('.csv'):
+        if not filepath.endswith(CSV_SUFFIXES):
+            raise ValueError("File should be in CSV format.")
+
+        try:
+            schema = self._resolve_schema(filepath, schema, sep, usecols, names)
+            options = dict(kind='csv', sep=sep, usecols=usecols, names=names, index_col=index_col, dtype=dtype,
+                           optimize_memory=optimize_memory, where=where, schema=schema)
+            extra = schema_kwargs(schema, dtype, usecols) if schema is not None else {}
+            dtype = extra.pop('dtype', dtype)
+            extra = self._date_kwargs(filepath, parse_dates, extra, sep, names)
+            options['parse_dates'] = parse_dates
+
+            self.data = self._from_cache(filepath, options)
+            if self.data is not None:
+                self.memory_report = None  # only known for a fresh parse
+                print(f"CSV file loaded from cache! Shape: {self.data.shape}")
+                return self._register(name)
+
+            sample = None
+            if optimize_memory:
+                sample = pd.read_csv(filepath, sep=sep, names=names, index_col=index_col, usecols=usecols,
+                                     dtype=dtype, nrows=SAMPLE_ROWS, **extra)
+                dtype = merge_dtypes({col: 'category' for col in categorical_candidates(sample)}, dtype)
+
+            if workers is not None and workers > 1:
+                self.data = self._read_csv_parallel(filepath, workers, chunk_bytes or DEFAULT_CHUNK_BYTES,
+                                                    quoted_newlines, where, sep=sep, names=names, index_col=index_col,
+                                                    usecols=usecols, dtype=dtype, **extra)
+            elif where is not None:
+                reader = pd.read_csv(
+                    filepath,
+                    sep=sep,
+                    names=names,
+                    index_col=index_col,
+                    usecols=usecols,
+                    dtype=dtype,
+                    chunksize=self._rows_for_bytes(filepath, chunk_bytes or DEFAULT_CHUNK_BYTES),
+                    **extra
+                )
+                with reader:
+                    self.data = concat_frames((_filter_rows(chunk, where) for chunk in reader),
+                                              ignore_index=index_col is None)
+            else:
+                self.data = pd.read_csv(
+                    filepath,
+                    sep=sep,
+                    names=names,
+                    index_col=index_col,
+                    usecols=usecols,
+                    dtype=dtype,
+                    **extra
+                )
+            if optimize_memory:
+                self.data = self._optimize(self.data, sample)
+            self._to_cache(filepath, options, self.data)
+            print(f"CSV file loaded successfully! Shape: {self.data.shape}")
+            return self._register(name)
+        except Exception as e:
+            raise RuntimeError(f"Error loading CSV: {e}")
+
+    def stream_csv(self, filepath, chunksize=None, chunk_bytes=None, sep=',', usecols=None, names=None, index_col=None, dtype=None,
+                   optimize_memory=False, where=None, prefetch=0, schema=None, parse_dates=None):
+        """
+        Streams a CSV file as a sequence of Pandas DataFrame chunks.
+
+        The chunks are not stored in self.data, so peak memory is bounded by
+        the chunk size instead of the file size.
+
+        Parameters:
+            - filepath (str): Path to the CSV file, optionally compressed (.csv.gz, .csv.bz2, .csv.zst, .csv.xz).
+            - chunksize (int): Number of rows per chunk (default: None).
+            - chunk_bytes (int): Approximate size of a chunk in decompressed bytes, used when chunksize is not given (default: None, 64 MB).
+            - sep (str): Delimiter (default: ',').
+            - usecols (list): Columns to load (default: None, loads all).
+            - names (list): Column names (default: None).
+            - index_col (int/str): Column to use as index (default: None).
+            - dtype (dict): Data types for columns (default: None).
+            - optimize_memory (bool): Parse low-cardinality strings, found in a sample of the file,
+              as 'category' (default: False). Numeric columns keep their dtype so all chunks agree.
+            - where (str/callable): Row filter applied to each chunk, same as in load_csv (default: None).
+            - prefetch (int): Chunks parsed ahead in a background thread while the current one is
+              consumed; the returned PrefetchIterator reports queue depth and stall times (default: 0, off).
+            - schema (dict/str): Schema applied to every chunk, same as in load_csv, so all chunks get the
+              same dtypes (default: None).
+            - parse_dates (list): Columns to parse as datetimes with a format detected once, same as in
+              load_csv (default: None).
+
+        Returns:
+            - Iterator[pd.DataFrame]: Chunks of the dataset, in file order.
+        """
+        if not filepath.endswith(CSV_SUFFIXES):
             raise ValueError("File should be in CSV format.")
 
+        if chunksize is not None and chunksize <= 0:
+            raise ValueError("chunksize should be a positive integer.")
+
         try:
-            self.data = pd.read_csv(
+            if chunksize is None:
+                chunksize = self._rows_for_bytes(filepath, chunk_bytes or DEFAULT_CHUNK_BYTES)
+            schema = self._resolve_schema(filepath, schema, sep, usecols, names)
+            extra = schema_kwargs(schema, dtype, usecols) if schema is not None else {}
+            dtype = extra.pop('dtype', dtype)
+            extra = self._date_kwargs(filepath, parse_dates, extra, sep, names)
+
+            if optimize_memory:
+                sample = pd.read_csv(filepath, sep=sep, names=names, index_col=index_col, usecols=usecols,
+                                     dtype=dtype, nrows=SAMPLE_ROWS, **extra)
+                dtype = merge_dtypes({col: 'category' for col in categorical_candidates(sample)}, dtype)
+
+            reader = pd.read_csv(
                 filepath,
                 sep=sep,
                 names=names,
                 index_col=index_col,
                 usecols=usecols,
-                dtype=dtype
+                dtype=dtype,
+                chunksize=chunksize,
+                **extra
             )
-            print(f"CSV file loaded successfully! Shape: {self.data.shape}")
+        except Exception as e:
+            raise RuntimeError(f"Error loading CSV: {e}")
+
+        chunks = self._iter_chunks(reader, "CSV", where)
+        return PrefetchIterator(chunks, prefetch) if prefetch else chunks
+
+    def load_csv_files(self, filepaths, sep=',', usecols=None, names=None, index_col=None, dtype=None, workers=None,
+                       stream=False, parse_dates=None, name=None):
+        """
+        Loads several CSV files with the same layout in parallel worker processes.
+
+        Every file is parsed with the same arguments and must produce the same
+        columns and dtypes as the first one. Categorical columns may hold
+        different categories in each file; they stay categorical.
+
+        Parameters:
+            - filepaths (str/list): Glob pattern (e.g. 'drops/2024-05-*.csv') or list of paths.
+            - sep (str): Delimiter (default: ',').
+            - usecols (list): Columns to load (default: None, loads all).
+            - names (list): Column names (default: None).
+            - index_col (int/str): Column to use as index (default: None).
+            - dtype (dict): Data types for columns (default: None).
+            - workers (int): Number of worker processes (default: None, one per CPU).
+            - stream (bool): Yield one DataFrame per file instead of concatenating them (default: False).
+            - parse_dates (list): Columns to parse as datetimes, with formats detected once from the first
+              file and used for all of them (default: None).
+            - name (str): Register the dataset under this name, see get_data (default: None).
+
+        Returns:
+            - pd.DataFrame: Concatenated dataset, or Iterator[pd.DataFrame] in file order when stream is True.
+        """
+        filepaths = sorted(glob.glob(filepaths)) if isinstance(filepaths, str) else list(filepaths)
+        if not filepaths:
+            raise ValueError("No files matched.")
+        if not all(path.endswith(CSV_SUFFIXES) for path in filepaths):
+            raise ValueError("Files should be in CSV format.")
+
+        kwargs = dict(sep=sep, names=names, index_col=index_col, usecols=usecols, dtype=dtype)
+        kwargs.update(self._date_kwargs(filepaths[0], parse_dates, {}, sep, names))
+        workers = workers or default_workers(len(filepaths))
+        frames = self._iter_files(filepaths, kwargs, workers)
+        if stream:
+            return frames
+
+        self.data = concat_frames(frames, ignore_index=index_col is None)
+        print(f"{len(filepaths)} CSV files loaded successfully! Shape: {self.data.shape}")
+        return self._register(name)
+
+    @staticmethod
+    def _iter_files(filepaths, kwargs, workers):
+        """
+        Yields the parsed files in order, checking each schema against the first file.
+        """
+        results = ordered_map(_read_csv_file, ((path, kwargs) for path in filepaths), workers)
+        schema = None
+        for path in filepaths:
+            try:
+                data = next(results)
+            except Exception as e:
+                raise RuntimeError(f"Error loading CSV {path}: {e}")
+
+            # categoricals match by kind only: every file has its own categories, concat_frames unions them
+            kinds = data.dtypes.map(lambda t: 'category' if isinstance(t, pd.CategoricalDtype) else t)
+            if schema is None:
+                schema, first = kinds, path
+            elif not kinds.equals(schema):
+                raise ValueError(f"Schema of {path} does not match {first}.\n"
+                                 f"Expected: {schema.to_dict()}\nFound: {data.dtypes.to_dict()}")
+            yield data
+
+    def _read_csv_parallel(self, filepath, workers, chunk_bytes, quoted_newlines, where=None, names=None, index_col=None,
+                           **kwargs):
+        """
+        Splits a CSV file into byte ranges aligned to record boundaries, parses
+        them in worker processes and concatenates the results in file order.
+
+        A boundary inside a quoted field is found from the parity of the quote
+        characters before it: the quotes of every range are counted in parallel
+        and each boundary moves to the first newline outside quotes.
+
+        Compressed files cannot be split by offset, so they are decompressed as
+        a stream in this process and cut into record aligned blocks that the
+        workers parse.
+        """
+        if chunk_bytes <= 0:
+            raise ValueError("chunk_bytes should be a positive integer.")
+
+        quotechar = b'"' if quoted_newlines else None
+        if names is None:  # the first record is the header
+            names = list(pd.read_csv(filepath, sep=kwargs['sep'], nrows=0).columns)
+            skip_header = True
+        else:
+            skip_header = False
+        kwargs = dict(kwargs, names=names, index_col=index_col)
+
+        if _is_compressed(filepath):
+            frames = ordered_map(_read_csv_bytes, ((payload, kwargs, where) for payload in
+                                                   self._iter_payloads(filepath, chunk_bytes, quotechar, skip_header)),
+                                 workers)
+            return concat_frames(frames, ignore_index=index_col is None)
+
+        size = os.path.getsize(filepath)
+
+        with open(filepath, 'rb') as f:
+            data_start = _next_record_start(f, 0, False, quotechar) if skip_header else 0
+
+            bounds = list(range(data_start, size, chunk_bytes))[1:]
+            if quotechar and bounds:
+                counts = ordered_map(_count_quotes, ((filepath, a, b, quotechar)
+                                                     for a, b in zip([data_start] + bounds, bounds)), workers)
+                parities, quotes = [], 0
+                for count in counts:
+                    quotes += count
+                    parities.append(quotes % 2 == 1)
+            else:
+                parities = [False] * len(bounds)
+
+            starts = [data_start]
+            for bound, in_quotes in zip(bounds, parities):
+                start = _next_record_start(f, bound, in_quotes, quotechar)
+                if starts[-1] < start < size:
+                    starts.append(start)
+
+        ranges = [(filepath, a, b, kwargs, where) for a, b in zip(starts, starts[1:] + [size])]
+        frames = ordered_map(_read_csv_range, ranges, workers)
+        return concat_frames(frames, ignore_index=index_col is None)
+
+    @staticmethod
+    def _iter_payloads(filepath, chunk_bytes, quotechar, skip_header):
+        """
+        Yields record aligned blocks of a decompressed file, without the header.
+        """
+        with _open_binary(filepath) as f:
+            for payload in _iter_record_blocks(f, chunk_bytes, quotechar):
+                if skip_header:
+                    payload = payload[_next_record_start(io.BytesIO(payload), 0, False, quotechar):]
+                    skip_header = False
+                if payload:
+                    yield payload
+
+    @staticmethod
+    def _iter_chunks(reader, kind, where=None, usecols=None):
+        """
+        Yields the (filtered, projected) chunks of a pandas reader, closing it when the consumer stops.
+        """
+        try:
+            with reader:
+                for chunk in reader:
+                    chunk = _filter_rows(chunk, where)
+                    if usecols is not None:  # records may lack some keys, those come out as NaN
+                        chunk = chunk.reindex(columns=list(usecols))
+                    yield chunk
+        except Exception as e:
+            raise RuntimeError(f"Error loading {kind}: {e}")
+
+    @staticmethod
+    def _rows_for_bytes(filepath, chunk_bytes):
+        """
+        Estimates how many rows of a text file fit in chunk_bytes, from the
+        average line length of the first SAMPLE_BYTES of the (decompressed) file.
+        """
+        if chunk_bytes <= 0:
+            raise ValueError("chunk_bytes should be a positive integer.")
+
+        with _open_binary(filepath) as f:
+            sample = f.read(SAMPLE_BYTES)
+
+        lines = sample.count(b'\n') or 1
+        return max(1, chunk_bytes * lines // max(len(sample), 1))
+
+    def infer_schema(self, filepath, sample_rows=SAMPLE_ROWS, sep=',', usecols=None, names=None, refresh=False):
+        """
+        Infers dtypes, date formats and categorical candidates of a CSV file from a sample.
+
+        Schemas are cached by header signature (header line, sep, usecols and
+        names), so files with the same layout, such as the daily partitions of
+        one feed, share one inferred schema.
+
+        Parameters:
+            - filepath (str): Path to the CSV file, optionally compressed.
+            - sample_rows (int): Rows read to infer the schema (default: 10000).
+            - sep (str): Delimiter (default: ',').
+            - usecols (list): Columns to load (default: None, loads all).
+            - names (list): Column names (default: None).
+            - refresh (bool): Infer again even if a schema is cached for this header (default: False).
+
+        Returns:
+            - dict: Schema to pass to load_csv / stream_csv, see dtypes.infer_schema.
+        """
+        if not filepath.endswith(CSV_SUFFIXES):
+            raise ValueError("File should be in CSV format.")
+
+        try:
+            key = self._header_key(filepath, sep, usecols, names)
+            if refresh or key not in self.schemas:
+                sample = pd.read_csv(filepath, sep=sep, usecols=usecols, names=names, nrows=sample_rows)
+                self.schemas[key] = infer_schema(sample)
+        except Exception as e:
+            raise RuntimeError(f"Error loading CSV: {e}")
+        return self.schemas[key]
+
+    def detect_date_formats(self, filepath, columns, sample_rows=SAMPLE_ROWS, sep=',', names=None):
+        """
+        Detects the datetime format of date columns of a CSV file from a sample.
+
+        Formats are cached by header signature and column, so the detection
+        runs once per layout rather than once per file or chunk.
+
+        Parameters:
+            - filepath (str): Path to the CSV file, optionally compressed.
+            - columns (list): Date columns.
+            - sample_rows (int): Rows read to detect the formats (default: 10000).
+            - sep (str): Delimiter (default: ',').
+            - names (list): Column names (default: None).
+
+        Returns:
+            - dict: Column -> format, for the columns whose format was detected.
+        """
+        try:
+            key = self._header_key(filepath, sep, None, names)
+            missing = [col for col in columns if (key, col) not in self.date_formats]
+            if missing:
+                sample = pd.read_csv(filepath, sep=sep, names=names, usecols=missing, dtype=str, nrows=sample_rows)
+        except Exception as e:
+            raise RuntimeError(f"Error loading CSV: {e}")
+        for col in missing:
+            self.date_formats[key, col] = guess_date_format(sample[col])
+        return {col: self.date_formats[key, col] for col in columns if self.date_formats[key, col] is not None}
+
+    def _date_kwargs(self, filepath, parse_dates, extra, sep, names):
+        """
+        Adds parse_dates and their detected formats to the read_csv arguments in extra.
+        """
+        if not parse_dates:
+            return extra
+        formats = self.detect_date_formats(filepath, parse_dates, sep=sep, names=names)
+        formats.update(extra.get('date_format') or {})
+        return dict(extra,
+                    parse_dates=list(dict.fromkeys(list(extra.get('parse_dates') or []) + list(parse_dates))),
+                    date_format=formats or None)
+
+    @staticmethod
+    def _header_key(filepath, sep, usecols, names):
+        """
+        Returns a signature of a CSV layout: its whole header line, however wide,
+        and the arguments shaping its columns.
+        """
+        digest = hashlib.sha256(repr((sep, usecols, names)).encode('utf-8'))
+        with _open_binary(filepath) as f:
+            for block in iter(lambda: f.read(SAMPLE_BYTES), b''):
+                end = block.find(b'\n')
+                digest.update(block if end == -1 else block[:end])
+                if end != -1:
+                    break
+        return digest.hexdigest()
+
+    def _resolve_schema(self, filepath, schema, sep, usecols, names):
+        """
+        Returns the schema to apply, inferring it when schema is 'auto'.
+        """
+        if isinstance(schema, str):
+            if schema != 'auto':
+                raise ValueError("schema should be a dict from infer_schema or 'auto'.")
+            return self.infer_schema(filepath, sep=sep, usecols=usecols, names=names)
+        return schema
+
+    def csv_index(self, filepath, names=None):
+        """
+        Returns the row offset index of a CSV file, building its sidecar file on first use.
+
+        Parameters:
+            - filepath (str): Path to the CSV file.
+            - names (list): Column names, when given the file is taken to have no header row (default: None).
+
+        Returns:
+            - CsvIndex: Byte offsets of the rows of the file.
+        """
+        if not filepath.endswith('.csv'):
+            raise ValueError("Row index needs an uncompressed CSV file.")
+
+        key = (os.path.abspath(filepath), names is None)
+        index = self.indexes.get(key)
+        if index is None or index.signature_changed():
+            index = self.indexes[key] = CsvIndex(filepath, header=names is None)
+        return index
+
+    def count_rows(self, filepath, names=None):
+        """
+        Returns the exact number of data rows of a CSV file from its index.
+        """
+        return len(self.csv_index(filepath, names))
+
+    def load_rows(self, filepath, start, stop, sep=',', usecols=None, names=None, dtype=None):
+        """
+        Loads rows start to stop-1 of a CSV file, reading only their bytes.
+
+        Parameters:
+            - filepath (str): Path to the CSV file.
+            - start (int): First row to load (0 is the first row after the header).
+            - stop (int): Row to stop before.
+            - sep (str): Delimiter (default: ',').
+            - usecols (list): Columns to load (default: None, loads all).
+            - names (list): Column names (default: None).
+            - dtype (dict): Data types for columns (default: None).
+
+        Returns:
+            - pd.DataFrame: Loaded rows, indexed by their row numbers.
+        """
+        index = self.csv_index(filepath, names)
+        begin, end = index.byte_range(start, stop)
+        first = slice(start, stop).indices(len(index))[0]
+
+        try:
+            with open(filepath, 'rb') as f:
+                f.seek(begin)
+                payload = f.read(end - begin)
+            self.data = self._parse_records(filepath, payload, sep, usecols, names, dtype)
+            self.data.index = pd.RangeIndex(first, first + len(self.data))
+            print(f"CSV rows loaded successfully! Shape: {self.data.shape}")
+            return self.data
+        except Exception as e:
+            raise RuntimeError(f"Error loading CSV: {e}")
+
+    def sample_rows(self, filepath, n, seed=None, sep=',', usecols=None, names=None, dtype=None):
+        """
+        Loads n rows of a CSV file picked uniformly at random, reading only their bytes.
+
+        Parameters:
+            - filepath (str): Path to the CSV file.
+            - n (int): Number of rows to sample (without replacement).
+            - seed (int): Random seed (default: None).
+            - sep (str): Delimiter (default: ',').
+            - usecols (list): Columns to load (default: None, loads all).
+            - names (list): Column names (default: None).
+            - dtype (dict): Data types for columns (default: None).
+
+        Returns:
+            - pd.DataFrame: Sampled rows in file order, indexed by their row numbers.
+        """
+        index = self.csv_index(filepath, names)
+        if n > len(index):
+            raise ValueError(f"Cannot sample {n} rows from a file with {len(index)} rows.")
+
+        rows = np.sort(np.random.default_rng(seed).choice(len(index), size=n, replace=False))
+        try:
+            with open(filepath, 'rb') as f:
+                parts = []
+                for row in rows:
+                    begin, end = index.byte_range(row, row + 1)
+                    f.seek(begin)
+                    part = f.read(end - begin)
+                    parts.append(part if part.endswith(b'\n') else part + b'\n')
+            self.data = self._parse_records(filepath, b''.join(parts), sep, usecols, names, dtype)
+            self.data.index = pd.Index(rows)
+            print(f"CSV rows sampled successfully! Shape: {self.data.shape}")
             return self.data
         except Exception as e:
             raise RuntimeError(f"Error loading CSV: {e}")
 
-    def load_excel(self, filepath, sheet_name=0, usecols=None, index_col=None, dtype=None):
+    def sample_csv(self, filepath, n, stratify_by=None, seed=None, chunksize=None, sep=',', usecols=None, names=None,
+                   dtype=None):
+        """
+        Draws a random sample of a CSV file in one streaming pass.
+
+        Every row gets a uniform random key and the rows with the n smallest
+        keys are kept, which is a uniform sample without replacement. When
+        stratify_by is given, up to n rows are kept per stratum and the final
+        sample takes from each stratum in proportion to its size in the file.
+        Memory is bounded by one chunk plus the kept rows.
+
+        Parameters:
+            - filepath (str): Path to the CSV file.
+            - n (int): Size of the sample.
+            - stratify_by (str): Column defining the strata (default: None, uniform sample).
+            - seed (int): Random seed (default: None).
+            - chunksize (int): Number of rows per streamed chunk (default: None, 64 MB chunks).
+            - sep (str): Delimiter (default: ',').
+            - usecols (list): Columns to load (default: None, loads all).
+            - names (list): Column names (default: None).
+            - dtype (dict): Data types for columns (default: None).
+
+        Returns:
+            - pd.DataFrame: Sampled rows in file order, indexed by their row numbers.
+        """
+        if n <= 0:
+            raise ValueError("n should be a positive integer.")
+        if stratify_by is not None and usecols is not None and stratify_by not in usecols:
+            raise ValueError("stratify_by should be one of usecols.")
+
+        rng = np.random.default_rng(seed)
+        reservoir, sizes = None, None
+        for chunk in self.stream_csv(filepath, chunksize=chunksize, sep=sep, usecols=usecols, names=names, dtype=dtype):
+            chunk[SAMPLE_KEY] = rng.random(len(chunk))
+            pool = chunk if reservoir is None else pd.concat([reservoir, chunk])
+
+            if stratify_by is None:
+                reservoir = pool.nsmallest(n, SAMPLE_KEY)
+            else:
+                counts = chunk[stratify_by].value_counts(dropna=False)
+                sizes = counts if sizes is None else sizes.add(counts, fill_value=0)
+                reservoir = pool.sort_values(SAMPLE_KEY).groupby(stratify_by, dropna=False, sort=False).head(n)
+
+        if reservoir is None:
+            raise ValueError("File has no rows to sample.")
+
+        if stratify_by is not None:
+            quotas = self._allocate(sizes, n)
+            reservoir = reservoir.sort_values(SAMPLE_KEY)
+            rank = reservoir.groupby(stratify_by, dropna=False, sort=False).cumcount()
+            reservoir = reservoir[rank.to_numpy() < reservoir[stratify_by].map(quotas).to_numpy()]
+
+        self.data = reservoir.drop(columns=SAMPLE_KEY).sort_index()
+        print(f"CSV file sampled successfully! Shape: {self.data.shape}")
+        return self.data
+
+    @staticmethod
+    def _allocate(sizes, n):
+        """
+        Splits n sample rows over strata in proportion to their sizes, using
+        largest remainders so the quotas add up to n (or to all rows).
+        """
+        sizes = sizes.astype('int64')
+        n = min(n, int(sizes.sum()))
+        exact = sizes * n / sizes.sum()
+        quotas = np.floor(exact).astype('int64')
+        shortfall = n - int(quotas.sum())
+        if shortfall > 0:
+            order = (exact - quotas).sort_values(ascending=False).index[:shortfall]
+            quotas[order] += 1
+        return quotas
+
+    @staticmethod
+    def _parse_records(filepath, payload, sep, usecols, names, dtype):
+        """
+        Parses raw CSV records (without header) using the header of filepath.
+        """
+        if names is None:
+            names = list(pd.read_csv(filepath, sep=sep, nrows=0).columns)
+        return pd.read_csv(io.BytesIO(payload), sep=sep, header=None, names=names, usecols=usecols, dtype=dtype)
+
+    def load_sparse_csv(self, filepath, sep=',', usecols=None, names=None, index_col=None, dtype='float32',
+                        format='csr', chunksize=None, name=None):
+        """
+        Loads a wide, mostly-zero numeric CSV file (one-hot features, counts) as a sparse matrix.
+
+        The file is parsed a bounded block of rows at a time, and each block is
+        converted to sparse before the next one is read, so the dense dataset
+        is never held in memory. Memory use is proportional to the nonzero
+        values plus one block.
+
+        Parameters:
+            - filepath (str): Path to the CSV file, optionally compressed (.gz, .bz2, .zst, .xz).
+            - sep (str): Delimiter used in the file (default: ',').
+            - usecols (list): Columns to load (default: None, loads all).
+            - names (list): Column names to use (default: None).
+            - index_col (str/int): Column holding the row labels, kept out of the matrix (default: None).
+            - dtype (str/np.dtype): Numeric type of the values (default: 'float32').
+            - format (str): 'csr' or 'csc' for a scipy.sparse matrix, 'pandas' for a DataFrame
+              of sparse columns (default: 'csr').
+            - chunksize (int): Rows parsed per block (default: None, about 16M cells per block).
+            - name (str): Register the dataset under this name, see get_data; 'pandas' format only (default: None).
+
+        Returns:
+            - scipy.sparse.csr_matrix/csc_matrix: For the 'csr'/'csc' formats. The row and column labels
+              are kept in self.sparse_labels.
+            - pd.DataFrame: For the 'pandas' format, with pd.SparseDtype columns.
+        """
+        if not filepath.endswith(CSV_SUFFIXES):
+            raise ValueError("File should be in CSV format.")
+        if format not in SPARSE_FORMATS:
+            raise ValueError(f"format should be one of {SPARSE_FORMATS}.")
+        if name is not None and format != 'pandas':
+            raise ValueError("Only the 'pandas' format can be registered under a name.")
+        sp = _import_scipy_sparse()
+
+        if chunksize is None:
+            header = pd.read_csv(filepath, sep=sep, usecols=usecols, names=names, index_col=index_col, nrows=0)
+            chunksize = max(1, SPARSE_CHUNK_CELLS // max(1, len(header.columns)))
+        elif chunksize <= 0:
+            raise ValueError("chunksize should be a positive integer.")
+
+        try:
+            reader = pd.read_csv(filepath, sep=sep, usecols=usecols, names=names, index_col=index_col,
+                                 dtype=dtype if index_col is None else None, chunksize=chunksize)
+            blocks, labels, columns = [], [], None
+            with reader:
+                for chunk in reader:
+                    columns = chunk.columns
+                    blocks.append(sp.csr_matrix(chunk.to_numpy(dtype=dtype)))
+                    labels.append(chunk.index)
+                    del chunk
+
+            if not blocks:
+                raise ValueError("The file has no data rows.")
+            matrix = sp.vstack(blocks, format=format if format != 'pandas' else 'csc')
+            del blocks
+            index = labels[0].append(labels[1:]) if index_col is not None else pd.RangeIndex(matrix.shape[0])
+        except Exception as e:
+            raise RuntimeError(f"Error loading sparse CSV: {e}")
+
+        density = matrix.nnz / max(1, matrix.shape[0] * matrix.shape[1])
+        print(f"Sparse CSV file loaded successfully! Shape: {matrix.shape}, density: {density:.4%}")
+        if format != 'pandas':
+            self.sparse_labels = (index, columns)
+            return matrix
+
+        # column by column: DataFrame.sparse.from_spmatrix may fill the missing cells with NaN instead of 0
+        sparse = pd.arrays.SparseArray.from_spmatrix
+        self.data = pd.DataFrame({col: sparse(matrix[:, [j]]) for j, col in enumerate(columns)}, index=index)
+        return self._register(name)
+
+    def load_jsonl(self, filepath, usecols=None, dtype=None, chunksize=None, chunk_bytes=None, where=None, name=None):
+        """
+        Loads a JSON Lines / NDJSON file (one JSON object per line) into a Pandas DataFrame.
+
+        The file is parsed in chunks, and each chunk is filtered and projected
+        to usecols before it is kept, so unused fields never accumulate in memory.
+
+        Parameters:
+            - filepath (str): Path to the .jsonl / .ndjson file, optionally compressed (.gz, .bz2, .zst, .xz).
+            - usecols (list): Fields to load (default: None, loads all).
+            - dtype (dict): Data types for fields (default: None, inferred).
+            - chunksize (int): Number of lines parsed at a time (default: None).
+            - chunk_bytes (int): Approximate size of a chunk in decompressed bytes, used when chunksize is not given (default: None, 64 MB).
+            - where (str/callable): Row filter applied to each chunk, same as in load_csv (default: None).
+            - name (str): Register the dataset under this name, see get_data (default: None).
+
+        Returns:
+            - pd.DataFrame: Loaded dataset.
+        """
+        chunks = self.stream_jsonl(filepath, chunksize, chunk_bytes, usecols, dtype, where)
+        try:
+            self.data = concat_frames(chunks)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Error loading JSON Lines: {e}")
+        print(f"JSON Lines file loaded successfully! Shape: {self.data.shape}")
+        return self._register(name)
+
+    def stream_jsonl(self, filepath, chunksize=None, chunk_bytes=None, usecols=None, dtype=None, where=None, prefetch=0):
+        """
+        Streams a JSON Lines / NDJSON file as a sequence of Pandas DataFrame chunks.
+
+        Parameters:
+            - filepath (str): Path to the .jsonl / .ndjson file, optionally compressed (.gz, .bz2, .zst, .xz).
+            - chunksize (int): Number of lines per chunk (default: None).
+            - chunk_bytes (int): Approximate size of a chunk in decompressed bytes, used when chunksize is not given (default: None, 64 MB).
+            - usecols (list): Fields to keep (default: None, keeps all).
+            - dtype (dict): Data types for fields (default: None, inferred).
+            - where (str/callable): Row filter applied to each chunk, same as in load_csv (default: None).
+            - prefetch (int): Chunks parsed ahead in a background thread, same as in stream_csv (default: 0, off).
+
+        Returns:
+            - Iterator[pd.DataFrame]: Chunks of the dataset, in file order.
+        """
+        if not filepath.endswith(JSONL_SUFFIXES):
+            raise ValueError("File should be in JSON Lines (.jsonl / .ndjson) format.")
+
+        if chunksize is not None and chunksize <= 0:
+            raise ValueError("chunksize should be a positive integer.")
+
+        try:
+            if chunksize is None:
+                chunksize = self._rows_for_bytes(filepath, chunk_bytes or DEFAULT_CHUNK_BYTES)
+            reader = pd.read_json(
+                filepath,
+                lines=True,
+                dtype=dtype if dtype is not None else True,
+                chunksize=chunksize
+            )
+        except Exception as e:
+            raise RuntimeError(f"Error loading JSON Lines: {e}")
+
+        chunks = self._iter_chunks(reader, "JSON Lines", where, usecols)
+        return PrefetchIterator(chunks, prefetch) if prefetch else chunks
+
+    def load_sql(self, connection, query, params=None, chunksize=SQL_CHUNK_ROWS, dtype=None, index_col=None,
+                 optimize_memory=False, name=None):
+        """
+        Loads the result of a SQL query into a Pandas DataFrame.
+
+        Rows are fetched from the cursor chunksize at a time and converted
+        chunk by chunk, so the raw result set is never held as Python tuples
+        all at once and no intermediate CSV export is needed.
+
+        Parameters:
+            - connection (str/sqlite3.Connection/DB-API connection/SQLAlchemy connectable): Database to query;
+              a str is opened as a SQLite database file and closed afterwards.
+            - query (str): SQL query to run.
+            - params (list/dict): Parameters bound to the query placeholders (default: None).
+            - chunksize (int): Rows fetched per chunk (default: 10000).
+            - dtype (dict): Data types for columns (default: None, inferred).
+            - index_col (str): Column to use as index (default: None).
+            - optimize_memory (bool): Same as in load_csv (default: False).
+            - name (str): Register the dataset under this name, see get_data (default: None).
+
+        Returns:
+            - pd.DataFrame: Loaded dataset.
+        """
+        chunks = self.stream_sql(connection, query, params, chunksize, dtype, index_col)
+        sample, categories, parts = None, None, []
+        try:
+            for chunk in chunks:
+                if optimize_memory and sample is None:  # plan the categorical columns from the first chunk
+                    sample = chunk.head(SAMPLE_ROWS)
+                    categories = dict.fromkeys(categorical_candidates(sample), 'category')
+                parts.append(chunk.astype(categories) if categories else chunk)
+            data = concat_frames(parts, ignore_index=index_col is None)  # every chunk is numbered from 0
+        except RuntimeError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Error loading SQL query: {e}")
+        del parts
+
+        self.data = self._optimize(data, sample) if optimize_memory else data
+        print(f"SQL query loaded successfully! Shape: {self.data.shape}")
+        return self._register(name)
+
+    def stream_sql(self, connection, query, params=None, chunksize=SQL_CHUNK_ROWS, dtype=None, index_col=None,
+                   prefetch=0):
+        """
+        Streams the result of a SQL query as a sequence of Pandas DataFrame chunks.
+
+        Parameters:
+            - connection (str/sqlite3.Connection/DB-API connection/SQLAlchemy connectable): Same as in load_sql.
+              For a server-side cursor on PostgreSQL/MySQL, pass a SQLAlchemy connection
+              opened with execution_options(stream_results=True).
+            - query (str): SQL query to run.
+            - params (list/dict): Parameters bound to the query placeholders (default: None).
+            - chunksize (int): Rows fetched per chunk (default: 10000).
+            - dtype (dict): Data types for columns (default: None, inferred).
+            - index_col (str): Column to use as index (default: None).
+            - prefetch (int): Chunks fetched ahead in a background thread, same as in stream_csv (default: 0, off).
+              A SQLite connection passed in must then allow use from other threads (check_same_thread=False).
+
+        Returns:
+            - Iterator[pd.DataFrame]: Chunks of the result, in cursor order.
+        """
+        if chunksize is None or chunksize <= 0:
+            raise ValueError("chunksize should be a positive integer.")
+
+        chunks = self._iter_sql(connection, query, params, chunksize, dtype, index_col, bool(prefetch))
+        return PrefetchIterator(chunks, prefetch) if prefetch else chunks
+
+    @staticmethod
+    def _iter_sql(connection, query, params, chunksize, dtype, index_col, threaded):
+        """
+        Yields the chunks of a query result, closing the connection when it was opened here.
+        """
+        opened = None
+        try:
+            if isinstance(connection, (str, os.PathLike)):
+                # the connection is only ever used by the thread running this generator
+                connection = opened = sqlite3.connect(connection, check_same_thread=not threaded)
+            yield from pd.read_sql_query(query, connection, index_col=index_col, params=params,
+                                         chunksize=chunksize, dtype=dtype)
+        except Exception as e:
+            raise RuntimeError(f"Error loading SQL query: {e}")
+        finally:
+            if opened is not None:
+                opened.close()
+
+    def load_excel(self, filepath, sheet_name=0, usecols=None, index_col=None, dtype=None, optimize_memory=False,
+                   name=None, workers=None, parse_dates=None):
         """
         Loads an Excel file into a Pandas DataFrame.
 
         Parameters:
             - filepath (str): Path to the Excel file.
-            - sheet_name (str/int): Sheet name or index (default: 0).
+            - sheet_name (str/int/list): Sheet name or index, a list of them, or None for all sheets (default: 0).
             - usecols (list): Columns to load (default: None, loads all).
             - index_col (int/str): Column to use as index (default: None).
             - dtype (dict): Data types for columns (default: None).
+            - optimize_memory (bool): Same as in load_csv, needs a single sheet (default: False).
+            - name (str): Register the dataset under this name, see get_data; needs a single sheet (default: None).
+            - workers (int): Processes parsing the sheets when several are loaded (default: None, one per CPU).
+            - parse_dates (list): Columns to parse as datetimes. For columns stored as text, the format is
+              detected once from a sample of the first sheet (default: None).
 
         Returns:
-            - pd.DataFrame: Loaded dataset.
+            - pd.DataFrame: Loaded dataset, or dict of sheet name to pd.DataFrame for several sheets.
         """
         if not filepath.endswith('.xlsx'):
             raise ValueError("File should be in Excel (.xlsx) format.")
 
+        single_sheet = isinstance(sheet_name, (str, int))
+        if optimize_memory and not single_sheet:
+            raise ValueError("optimize_memory requires a single sheet_name.")
+        if name is not None and not single_sheet:
+            raise ValueError("name requires a single sheet_name.")
+
+        options = dict(kind='excel', sheet_name=sheet_name, usecols=usecols, index_col=index_col, dtype=dtype,
+                       optimize_memory=optimize_memory, parse_dates=parse_dates)
+
         try:
+            self.data = self._from_cache(filepath, options)
+            if self.data is not None:
+                self.memory_report = None  # only known for a fresh parse
+                print(f"Excel file loaded from cache! Shape: {self.data.shape}")
+                return self._register(name)
+
+            extra = {}
+            if parse_dates:
+                extra = dict(parse_dates=list(parse_dates),
+                             date_format=self._excel_date_formats(filepath, sheet_name, parse_dates) or None)
+
+            sample = None
+            if optimize_memory:
+                sample = pd.read_excel(filepath, sheet_name=sheet_name, usecols=usecols, index_col=index_col,
+                                       dtype=dtype, nrows=SAMPLE_ROWS, **extra)
+                dtype = merge_dtypes({col: 'category' for col in categorical_candidates(sample)}, dtype)
+
+            if not single_sheet and workers != 1:
+                if sheet_name is None:
+                    with pd.ExcelFile(filepath) as workbook:
+                        sheets = workbook.sheet_names
+                else:
+                    sheets = list(sheet_name)
+                kwargs = dict(usecols=usecols, index_col=index_col, dtype=dtype, **extra)
+                frames = ordered_map(_read_excel_sheet, ((filepath, sheet, kwargs) for sheet in sheets),
+                                     workers or default_workers(len(sheets)))
+                self.data = dict(zip(sheets, frames))
+                print(f"Excel file loaded successfully! Sheets: {len(self.data)}")
+                return self.data
+
             self.data = pd.read_excel(
                 filepath,
                 sheet_name=sheet_name,
                 usecols=usecols,
                 index_col=index_col,
-                dtype=dtype
+                dtype=dtype,
+                **extra
             )
-            print(f"Excel file loaded successfully! Shape: {self.data.shape}")
-            return self.data
+            if optimize_memory:
+                self.data = self._optimize(self.data, sample)
+            self._to_cache(filepath, options, self.data)
+            if single_sheet:
+                print(f"Excel file loaded successfully! Shape: {self.data.shape}")
+            else:
+                print(f"Excel file loaded successfully! Sheets: {len(self.data)}")
+            return self._register(name)
         except Exception as e:
             raise RuntimeError(f"Error loading Excel file: {e}")
 
-    def get_data(self):
+    @staticmethod
+    def _excel_date_formats(filepath, sheet_name, columns):
+        """
+        Detects the format of date columns stored as text in an Excel sheet;
+        cells that already hold dates need none.
         """
-        Returns the loaded dataset.
+        sheet = sheet_name if isinstance(sheet_name, (str, int)) else (list(sheet_name or [0]) or [0])[0]
+        sample = pd.read_excel(filepath, sheet_name=sheet, usecols=list(columns), nrows=SAMPLE_ROWS)
+        formats = {}
+        for col in columns:
+            if pd.api.types.is_string_dtype(sample[col]):
+                fmt = guess_date_format(sample[col])
+                if fmt is not None:
+                    formats[col] = fmt
+        return formats
+
+    def stream_excel(self, filepath, sheet_name=0, chunksize=EXCEL_CHUNK_ROWS, usecols=None, index_col=None, dtype=None,
+                     prefetch=0):
         """
+        Streams a sheet of an Excel file as a sequence of Pandas DataFrame chunks.
+
+        The workbook is opened in openpyxl's read-only mode, which parses the
+        sheet XML lazily instead of building the whole workbook in memory.
+        The first row is the header and rows that are entirely empty are skipped.
+
+        Parameters:
+            - filepath (str): Path to the Excel file.
+            - sheet_name (str/int): Sheet name or index (default: 0).
+            - chunksize (int): Number of rows per chunk (default: 10000).
+            - usecols (list): Column names or positions to load (default: None, loads all).
+            - index_col (int/str): Column to use as index (default: None).
+            - dtype (dict): Data types for columns (default: None).
+            - prefetch (int): Chunks parsed ahead in a background thread, same as in stream_csv (default: 0, off).
+
+        Returns:
+            - Iterator[pd.DataFrame]: Chunks of the sheet, in row order.
+        """
+        if not filepath.endswith('.xlsx'):
+            raise ValueError("File should be in Excel (.xlsx) format.")
+        if chunksize <= 0:
+            raise ValueError("chunksize should be a positive integer.")
+
+        openpyxl = _import_openpyxl()
+        try:
+            workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        except Exception as e:
+            raise RuntimeError(f"Error loading Excel file: {e}")
+
+        chunks = self._iter_excel_chunks(workbook, sheet_name, chunksize, usecols, index_col, dtype)
+        return PrefetchIterator(chunks, prefetch) if prefetch else chunks
+
+    @staticmethod
+    def _iter_excel_chunks(workbook, sheet_name, chunksize, usecols, index_col, dtype):
+        """
+        Yields chunks of the rows of a read-only workbook sheet, closing the workbook at the end.
+        """
+        try:
+            sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+            rows = (row for row in sheet.iter_rows(values_only=True) if any(v is not None for v in row))
+            header = next(rows, None)
+            if header is None:
+                return
+
+            start = 0
+            while True:
+                block = list(itertools.islice(rows, chunksize))
+                if not block:
+                    return
+                chunk = pd.DataFrame.from_records(block, columns=list(header),
+                                                  index=pd.RangeIndex(start, start + len(block)))
+                start += len(block)
+
+                if usecols is not None:
+                    usecols = list(usecols)
+                    chunk = chunk.iloc[:, usecols] if all(isinstance(c, int) for c in usecols) else chunk[usecols]
+                if dtype is not None:
+                    chunk = chunk.astype(dtype)
+                if index_col is not None:
+                    chunk = chunk.set_index(chunk.columns[index_col] if isinstance(index_col, int) else index_col)
+                yield chunk
+        except Exception as e:
+            raise RuntimeError(f"Error loading Excel file: {e}")
+        finally:
+            workbook.close()
+
+    def load_parquet(self, filepath, usecols=None, filters=None, index_col=None, optimize_memory=False, name=None):
+        """
+        Loads a Parquet file into a Pandas DataFrame.
+
+        Only the requested columns are read, and row groups whose min/max
+        statistics cannot satisfy the filters are skipped without decoding.
+
+        Parameters:
+            - filepath (str): Path to the Parquet file.
+            - usecols (list): Columns to load (default: None, loads all).
+            - filters (list/pyarrow.compute.Expression): Row filters, either a pyarrow expression or
+              tuples such as [('region', '==', 'EU'), ('value', '>', 0)] (default: None).
+            - index_col (str): Column to use as index (default: None).
+            - optimize_memory (bool): Same as in load_csv (default: False).
+            - name (str): Register the dataset under this name, see get_data (default: None).
+
+        Returns:
+            - pd.DataFrame: Loaded dataset.
+        """
+        if not filepath.endswith(('.parquet', '.pq')):
+            raise ValueError("File should be in Parquet format.")
+
+        try:
+            self.data = self._load_arrow(filepath, 'parquet', usecols, filters, index_col, optimize_memory)
+            print(f"Parquet file loaded successfully! Shape: {self.data.shape}")
+            return self._register(name)
+        except Exception as e:
+            raise RuntimeError(f"Error loading Parquet file: {e}")
+
+    def load_feather(self, filepath, usecols=None, filters=None, index_col=None, optimize_memory=False, name=None):
+        """
+        Loads a Feather / Arrow IPC file into a Pandas DataFrame.
+
+        The file is memory-mapped and only the requested columns are read.
+        Arrow IPC files carry no row group statistics, so filters are applied
+        batch by batch while scanning.
+
+        Parameters:
+            - filepath (str): Path to the Feather / Arrow IPC file.
+            - usecols (list): Columns to load (default: None, loads all).
+            - filters (list/pyarrow.compute.Expression): Row filters, same format as in load_parquet (default: None).
+            - index_col (str): Column to use as index (default: None).
+            - optimize_memory (bool): Same as in load_csv (default: False).
+            - name (str): Register the dataset under this name, see get_data (default: None).
+
+        Returns:
+            - pd.DataFrame: Loaded dataset.
+        """
+        if not filepath.endswith(('.feather', '.arrow', '.ipc')):
+            raise ValueError("File should be in Feather / Arrow IPC format.")
+
+        try:
+            self.data = self._load_arrow(filepath, 'ipc', usecols, filters, index_col, optimize_memory)
+            print(f"Feather file loaded successfully! Shape: {self.data.shape}")
+            return self._register(name)
+        except Exception as e:
+            raise RuntimeError(f"Error loading Feather file: {e}")
+
+    def _load_arrow(self, filepath, fmt, usecols, filters, index_col, optimize_memory=False):
+        """
+        Reads a columnar file through a pyarrow dataset scan with column
+        projection and predicate pushdown.
+        """
+        ds, pq = _import_pyarrow()
+
+        if filters is not None and not isinstance(filters, ds.Expression):
+            filters = pq.filters_to_expression(filters)
+
+        columns = None
+        if usecols is not None:
+            columns = list(usecols)
+            if index_col is not None and index_col not in columns:
+                columns.append(index_col)
+
+        table = ds.dataset(filepath, format=fmt).to_table(columns=columns, filter=filters)
+
+        sample = None
+        if optimize_memory:  # dictionary encoded arrow columns convert straight to 'category'
+            sample = table.slice(0, SAMPLE_ROWS).to_pandas()
+            for col in categorical_candidates(sample):
+                i = table.schema.get_field_index(col)
+                table = table.set_column(i, col, table.column(i).dictionary_encode())
+
+        data = table.to_pandas()
+        del table
+        if index_col is not None:
+            data = data.set_index(index_col)
+            if sample is not None:
+                sample = sample.set_index(index_col)
+        if optimize_memory:
+            data = self._optimize(data, sample)
+        return data
+
+    def _optimize(self, data, sample):
+        """
+        Narrows the numeric columns of a freshly parsed dataset and reports the
+        memory saved per column in self.memory_report.
+        """
+        data = downcast_frame(data)
+        self.memory_report = memory_report(sample, data)
+        before, after = self.memory_report['bytes_before'].sum(), self.memory_report['bytes_after'].sum()
+        print(f"Memory usage optimized: {before / 1024 ** 2:.2f} MB -> {after / 1024 ** 2:.2f} MB")
+        return data
+
+    def export_mmap(self, directory, data=None):
+        """
+        Writes a dataset as a memory-mappable column store (one .npy file per column).
+
+        Parameters:
+            - directory (str): Target directory, created if missing.
+            - data (pd.DataFrame): Dataset to write (default: None, the loaded dataset).
+        """
+        if data is None:
+            data = self.get_data()
+
+        try:
+            write_store(data, directory)
+            print(f"Dataset exported successfully! Shape: {data.shape}")
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Error exporting dataset: {e}")
+
+    def load_mmap(self, directory, usecols=None, name=None):
+        """
+        Opens a column store written by export_mmap without parsing or copying it.
+
+        Columns are copy-on-write np.memmap arrays, so worker processes opening
+        the same store share one copy of the data through the OS page cache.
+
+        Parameters:
+            - directory (str): Directory of the store.
+            - usecols (list): Columns to open (default: None, opens all).
+            - name (str): Register the dataset under this name, see get_data (default: None).
+
+        Returns:
+            - pd.DataFrame: Loaded dataset.
+        """
+        try:
+            self.data = read_store(directory, usecols)
+            print(f"Memory-mapped dataset loaded successfully! Shape: {self.data.shape}")
+            return self._register(name)
+        except Exception as e:
+            raise RuntimeError(f"Error loading memory-mapped dataset: {e}")
+
+    def _from_cache(self, filepath, options):
+        """
+        Returns the cached parse of filepath, or None when caching is off or on a miss.
+        """
+        if self.cache is None or callable(options.get('where')):  # a function has no stable cache key
+            return None
+        return self.cache.get(filepath, options)
+
+    def _to_cache(self, filepath, options, data):
+        """
+        Stores a parsed DataFrame in the cache when caching is on.
+        """
+        if self.cache is not None and isinstance(data, pd.DataFrame) and not callable(options.get('where')):
+            self.cache.put(filepath, options, data)
+
+    def clear_cache(self, filepath=None):
+        """
+        Invalidates the parse-once cache.
+
+        Parameters:
+            - filepath (str): Source file whose cached parses are removed (default: None, clears the whole cache).
+        """
+        if self.cache is not None:
+            self.cache.invalidate(filepath)
+
+    @property
+    def data(self):
+        """
+        The most recently loaded dataset.
+        """
+        if self.current is not None:
+            return self.registry.get(self.current)
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self.current = None
+
+    def _register(self, name):
+        """
+        Moves a freshly loaded dataset into the registry when it is named.
+        """
+        data = self._data
+        if name is not None:
+            self.add_data(name, data)
+        return data
+
+    def add_data(self, name, data):
+        """
+        Registers a dataset under name, replacing any dataset with the same name.
+
+        Parameters:
+            - name (str): Name of the dataset.
+            - data (pd.DataFrame): Dataset to register.
+        """
+        self.registry.add(name, data)
+        self._data = None
+        self.current = name
+
+    def remove_data(self, name):
+        """
+        Removes a named dataset, from memory and from the spill directory.
+        """
+        self.registry.remove(name)
+        if self.current == name:
+            self.current = None
+
+    def get_data(self, name=None):
+        """
+        Returns a loaded dataset.
+
+        Parameters:
+            - name (str): Name the dataset was loaded with; spilled datasets are
+              read back from disk transparently (default: None, the last loaded dataset).
+        """
+        if name is not None:
+            return self.registry.get(name)
+
         if self.data is None:
             raise ValueError("No dataset loaded. Please load a dataset first.")
         return self.data
\ No newline at end of file
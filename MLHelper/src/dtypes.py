@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+SAMPLE_ROWS = 10000  # rows read from the head of a file to plan its dtypes
+CATEGORY_RATIO = 0.5  # string columns with at most this share of distinct values become categorical
+
+
+def categorical_candidates(sample, max_ratio=CATEGORY_RATIO):
+    """
+    Finds the low-cardinality string columns of a sample.
+
+    Parameters:
+        - sample (pd.DataFrame): Rows sampled from the dataset.
+        - max_ratio (float): Maximum share of distinct values in a column (default: 0.5).
+
+    Returns:
+        - list: Names of the columns worth storing as 'category'.
+    """
+    candidates = []
+    for col in sample.columns:
+        series = sample[col]
+        if isinstance(series.dtype, pd.CategoricalDtype) or not pd.api.types.is_string_dtype(series):
+            continue
+        if series.nunique(dropna=True) <= max_ratio * max(len(series), 1):
+            candidates.append(col)
+    return candidates
+
+
+def guess_date_format(series):
+    """
+    Detects the strftime format of a column of date strings.
+
+    Formats are guessed from the first value, month-first and day-first,
+    and the first one under which every distinct non-null value of the
+    series parses is returned, so a day above 12 anywhere in the sample
+    settles '%m/%d' against '%d/%m'.
+
+    Parameters:
+        - series (pd.Series): Sample of a column.
+
+    Returns:
+        - str: Format such as '%Y-%m-%d %H:%M:%S', or None if the column does not hold dates.
+    """
+    values = series.dropna()
+    if values.empty or not pd.api.types.is_string_dtype(values):
+        return None
+
+    values = pd.Series(values.unique())
+    first = str(values.iloc[0])
+    for fmt in dict.fromkeys(guess_datetime_format(first, dayfirst=dayfirst) for dayfirst in (False, True)):
+        if fmt is not None and pd.to_datetime(values, format=fmt, errors='coerce').notna().all():
+            return fmt
+    return None
+
+
+def infer_schema(sample, max_ratio=CATEGORY_RATIO):
+    """
+    Infers a reusable schema from a sample of a dataset.
+
+    Integer and boolean columns get the nullable 'Int64' / 'boolean' dtypes:
+    the sample having no missing values does not mean the rest of the file,
+    or another file with the same layout, has none.
+
+    Parameters:
+        - sample (pd.DataFrame): Rows sampled from the dataset, parsed with the default dtypes.
+        - max_ratio (float): Maximum share of distinct values of a categorical column (default: 0.5).
+
+    Returns:
+        - dict: 'columns', 'dtype' (column -> dtype name), 'parse_dates' (date columns),
+          'date_formats' (date column -> format) and 'categories' (categorical candidates).
+    """
+    schema = {'columns': list(sample.columns), 'dtype': {}, 'parse_dates': [], 'date_formats': {}, 'categories': []}
+    categories = set(categorical_candidates(sample, max_ratio))
+
+    for col in sample.columns:
+        series = sample[col]
+        fmt = guess_date_format(series) if pd.api.types.is_string_dtype(series) else None
+        if fmt is not None:
+            schema['parse_dates'].append(col)
+            schema['date_formats'][col] = fmt
+        elif col in categories:
+            schema['categories'].append(col)
+            schema['dtype'][col] = 'category'
+        elif pd.api.types.is_bool_dtype(series):  # nullable, a blank may follow the sample
+            schema['dtype'][col] = 'boolean'
+        elif pd.api.types.is_integer_dtype(series):
+            schema['dtype'][col] = 'UInt64' if pd.api.types.is_unsigned_integer_dtype(series) else 'Int64'
+        else:
+            schema['dtype'][col] = str(series.dtype)
+    return schema
+
+
+def schema_kwargs(schema, dtype=None, usecols=None):
+    """
+    Turns a schema into read_csv arguments, so pandas skips type inference.
+
+    Parameters:
+        - schema (dict): Schema from infer_schema.
+        - dtype (dict): User given dtypes, which override the schema (default: None).
+        - usecols (list): Columns being loaded (default: None, all columns).
+
+    Returns:
+        - dict: dtype, parse_dates and date_format arguments.
+    """
+    keep = (lambda col: True) if usecols is None else (lambda col: col in usecols)
+    dates = [col for col in schema['parse_dates'] if keep(col)]
+    return {
+        'dtype': merge_dtypes({col: t for col, t in schema['dtype'].items() if keep(col)}, dtype),
+        'parse_dates': dates or None,
+        'date_format': {col: schema['date_formats'][col] for col in dates} or None,
+    }
+
+
+def merge_dtypes(planned, dtype):
+    """
+    Combines planned dtypes with user given ones, the user's choice wins.
+
+    A single dtype for all columns (e.g. dtype=str) is kept as it is.
+    """
+    if dtype is not None and not isinstance(dtype, dict):
+        return dtype
+    merged = dict(planned)
+    merged.update(dtype or {})
+    return merged or None
+
+
+def downcast_numeric(series):
+    """
+    Converts a numeric series to the narrowest dtype that holds every value exactly.
+
+    Integers go to the smallest signed integer type covering their range.
+    Floats go to float32 only when all values round-trip through it unchanged.
+    Other series are returned unchanged.
+    """
+    if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+        return series
+    if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):  # nullable / arrow types keep their semantics
+        return series
+
+    if pd.api.types.is_integer_dtype(series):
+        return pd.to_numeric(series, downcast='integer')
+
+    if series.dtype == np.float64:
+        narrow = series.astype(np.float32)
+        if np.array_equal(narrow.to_numpy(np.float64), series.to_numpy(), equal_nan=True):
+            return narrow
+    return series
+
+
+def downcast_frame(data, columns=None):
+    """
+    Applies downcast_numeric column by column, so at most one extra column is alive at a time.
+
+    Parameters:
+        - data (pd.DataFrame): Dataset, modified in place.
+        - columns (list): Columns to downcast (default: None, all columns).
+
+    Returns:
+        - pd.DataFrame: The same dataset with narrowed numeric columns.
+    """
+    for col in (data.columns if columns is None else columns):
+        data[col] = downcast_numeric(data[col])
+    return data
+
+
+def memory_report(sample, data):
+    """
+    Compares per column memory of a dataset before and after optimization.
+
+    The 'before' figures are extrapolated from a sample parsed with the
+    default dtypes, since the unoptimized dataset is never materialized.
+
+    Parameters:
+        - sample (pd.DataFrame): Sample parsed with the default dtypes.
+        - data (pd.DataFrame): Optimized dataset.
+
+    Returns:
+        - pd.DataFrame: dtype_before, dtype_after, bytes_before and bytes_after per column.
+    """
+    scale = len(data) / max(len(sample), 1)
+    before = sample.memory_usage(deep=True, index=False).reindex(data.columns)
+    return pd.DataFrame({
+        'dtype_before': sample.dtypes.reindex(data.columns).astype(str),
+        'dtype_after': data.dtypes.astype(str),
+        'bytes_before': (before * scale).round().astype('Int64'),
+        'bytes_after': data.memory_usage(deep=True, index=False),
+    })
+
+
+def concat_frames(frames, ignore_index=False):
+    """
+    Concatenates parts of one dataset, keeping categorical columns categorical.
+
+    Parts parsed separately get different categories for the same column,
+    which pd.concat would turn back into objects; the categories are unioned
+    first so only the integer codes are remapped.
+    """
+    frames = list(frames)
+    if len(frames) > 1:
+        for col in frames[0].columns:
+            if all(isinstance(f[col].dtype, pd.CategoricalDtype) for f in frames):
+                categories = pd.api.types.union_categoricals([f[col] for f in frames]).categories
+                for f in frames:
+                    f[col] = f[col].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=ignore_index)
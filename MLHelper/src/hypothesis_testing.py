@@ -1,18 +1,154 @@
+import hashlib
 import warnings
+from array import array
+from collections import OrderedDict
+from typing import NamedTuple
 import numpy as np
 import pandas as pd
 import scipy.stats as stats
+from .summary_stats import ContingencyTable, CorrelationStats, RunningStats
+
+
+class TestResult(NamedTuple):
+    """
+        Compact record of one hypothesis test, returned by the tests in quiet mode.
+    """
+    test: str  # name of the test
+    statistic: float  # test statistic
+    p_value: float
+    rejected: bool  # True when the null hypothesis is rejected
+    n: int  # number of observations (pairs for paired tests) used
+    assumptions: dict  # assumption checks the test used, e.g. {'normal': True, 'equal_var': False}
+
+
+class ResultsTable():
+    """
+        Columnar collection of test results. Numeric columns and assumption flags are kept
+        in typed arrays (one int8 column per flag, -1 where a test did not check it), so each
+        result takes a few tens of bytes. The table grows with every result collected,
+        call clear() to empty it.
+    """
+    def __init__(self):
+        self.test = []  # references to the shared test names
+        self.statistic = array("d")
+        self.p_value = array("d")
+        self.rejected = array("b")
+        self.n = array("q")
+        self.flags = {}  # assumption name -> array("b") of 1 passed, 0 failed, -1 not checked
+
+    def __len__(self):
+        return len(self.p_value)
+
+    def _flag(self, name):
+        if name not in self.flags:
+            self.flags[name] = array("b", [-1]) * len(self)  # earlier results did not check it
+        return self.flags[name]
+
+    def append(self, result):
+        """
+            inputs:
+                result : TestResult to add
+        """
+        for name, passed in result.assumptions.items():
+            self._flag(name).append(int(passed))
+        for name, column in self.flags.items():
+            if name not in result.assumptions:
+                column.append(-1)
+        self.test.append(result.test)
+        self.statistic.append(result.statistic)
+        self.p_value.append(result.p_value)
+        self.rejected.append(result.rejected)
+        self.n.append(result.n)
+
+    def extend(self, test, statistics, p_values, rejected, n, assumptions):
+        """
+            inputs:
+                test : name of the test, shared by all the results
+                statistics, p_values, rejected, n : arrays with one value per result
+                assumptions : dict of assumption name -> bool, or bool array with one value per result
+        """
+        count = len(p_values)
+        for name, passed in assumptions.items():
+            values = np.broadcast_to(np.asarray(passed, dtype=np.int8), (count,))
+            self._flag(name).frombytes(values.tobytes())
+        for name, column in self.flags.items():
+            if name not in assumptions:
+                column.extend(array("b", [-1]) * count)
+        self.test.extend([test] * count)
+        self.statistic.frombytes(np.asarray(statistics, dtype=np.float64).tobytes())
+        self.p_value.frombytes(np.asarray(p_values, dtype=np.float64).tobytes())
+        self.rejected.frombytes(np.asarray(rejected, dtype=np.int8).tobytes())
+        self.n.frombytes(np.broadcast_to(np.asarray(n, dtype=np.int64), (count,)).tobytes())
+
+    def clear(self):
+        """
+            Removes all the results.
+        """
+        self.__init__()
+
+    def toFrame(self):
+        """
+            output:
+                DataFrame with one row per result, one column per TestResult field and
+                one nullable boolean column per assumption flag (NA where not checked)
+        """
+        frame = pd.DataFrame({
+            "test": self.test,
+            "statistic": np.frombuffer(self.statistic, dtype=np.float64),
+            "p_value": np.frombuffer(self.p_value, dtype=np.float64),
+            "rejected": np.frombuffer(self.rejected, dtype=np.int8).astype(bool),
+            "n": np.frombuffer(self.n, dtype=np.int64),
+        })
+        for name, column in self.flags.items():
+            values = np.frombuffer(column, dtype=np.int8)
+            frame[name] = pd.arrays.BooleanArray(values == 1, values < 0)
+        return frame
+
 
 class TestHypothesis():
     """
         This class contains methods to perform various test hypothesis.
+        The t-tests and ANOVA also accept RunningStats summaries in place of samples.
+        In quiet mode the tests return a TestResult instead of (rejected, p_value)
+        and, unless collect_results is off, collect it in self.results.
     """
-    def __init__(self, significance_level = 0.05):
+    def __init__(self, significance_level = 0.05, cache_size = 1024, quiet = False, collect_results = True):
         """
             inputs:
                 significance_level : alpha value (default 0.05)
+                cache_size : number of normality checks remembered, 0 to disable (default 1024)
+                quiet : when True nothing is printed and tests return a TestResult (default False)
+                collect_results : in quiet mode, also collect every result in self.results;
+                                  long running callers should turn it off or call self.results.clear() (default True)
         """
         self.significance_level = significance_level
+        self.quiet = quiet
+        self.collect_results = collect_results
+        self.results = ResultsTable()
+        self.cache_size = cache_size
+        self.assumption_cache = OrderedDict()  # (fingerprint, significance_level) -> isNormal result, least recently used first
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _fingerprint(self, feature):
+        """
+            inputs:
+                feature : sequence of data containing numeric values
+            output:
+                hashable key of the array content, None when it cannot be hashed
+        """
+        values = np.asarray(feature)
+        if values.dtype.hasobject:
+            return None
+        raw = np.ascontiguousarray(values).reshape(-1).view(np.uint8)  # bytes of any dtype, e.g. timedelta64
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        return digest, values.dtype.str, values.shape
+
+    def clearCache(self):
+        """
+            Forgets all remembered assumption checks.
+        """
+        self.assumption_cache.clear()
 
     def isNormal(self, feature):
         """
@@ -22,6 +158,29 @@ class TestHypothesis():
                 True : if feature is normal
                 False : if feature is not normal
 
+            Results are remembered by array content and significance level, so checking
+            the same feature again (e.g. inside hasEqualVariance) skips the test.
+        """
+        fingerprint = self._fingerprint(feature) if self.cache_size > 0 else None
+        if fingerprint is None:
+            return self._isNormal(feature)
+
+        key = (fingerprint, self.significance_level)
+        if key in self.assumption_cache:
+            self.cache_hits += 1
+            self.assumption_cache.move_to_end(key)
+            return self.assumption_cache[key]
+
+        self.cache_misses += 1
+        result = self._isNormal(feature)
+        self.assumption_cache[key] = result
+        while len(self.assumption_cache) > self.cache_size:
+            self.assumption_cache.popitem(last=False)
+        return result
+
+    def _isNormal(self, feature):
+        """
+            Uncached normality check used by isNormal.
         """
         if len(feature) > 5000:  # When sample size > 5000 shapiro doesn't work good.
             p_value = stats.kstest(feature, 'norm', args=(np.mean(feature), np.std(feature))).pvalue
@@ -55,24 +214,54 @@ class TestHypothesis():
                 True, p_value : When the null hypothesis is rejected.
                 False, p_value : When the null hypothesis is not rejected.
         """
+        if self.quiet:
+            return p_value < self.significance_level, p_value
         if p_value < self.significance_level:  # if pvalue < alpha we reject null hypothesis
             print("Null Hypothesis rejected.\nThere is a significance difference.")
             return True, p_value
         else:
             print("Not enough evidence to reject Null Hypotheses.\nThere is no significance difference.")
             return False, p_value
+
+    def _result(self, test, statistic, p_value, n, assumptions):
+        """
+            inputs:
+                test : name of the test
+                statistic : test statistic
+                p_value : p_value of the test
+                n : number of observations used
+                assumptions : dict of the assumption checks used
+            output:
+                TestResult in quiet mode, else (rejected, p_value) like checkSignificance
+        """
+        if not self.quiet:
+            return self.checkSignificance(p_value)
+
+        p_value = float(p_value)
+        assumptions = {name: bool(passed) for name, passed in assumptions.items()}  # numpy bools to plain ones
+        result = TestResult(test, float(statistic), p_value, p_value < self.significance_level, int(n), assumptions)
+        if self.collect_results:
+            self.results.append(result)
+        return result
         
     def OneSampleTtest(self, feature, meu, clt = False):
         """
             inputs:
-                feature : Sequence of numeric data (sample)
+                feature : Sequence of numeric data (sample), or its RunningStats summary
                 meu : Population mean
                 clt : to apply CLT or not (default False)
             output:
                 True, p_value : When the null hypothesis is rejected.
                 False, p_value : When the null hypothesis is not rejected.
         """
-        if not self.isNormal(feature): # feature should be normal for t-test
+        if isinstance(feature, RunningStats):  # normality can't be checked without the sample
+            (n, mean, var), = self._summaries(feature)
+            ttest = (mean - meu) / np.sqrt(var / n)
+            p_value = 2 * stats.t.sf(abs(ttest), n - 1)
+            return self._result("one sample t-test", ttest, p_value, n, {})
+
+        normal = self.isNormal(feature)
+        if not normal: # feature should be normal for t-test
             if not clt:  # if don't want to apply clt
                 raise ValueError("Sample is not Normally distributed")
             elif len(feature) <= 30:  # if len(feature) > 30 clt can be applied
@@ -80,24 +269,32 @@ class TestHypothesis():
         
         ttest, p_value = stats.ttest_1samp(feature, meu)
 
-        return self.checkSignificance(p_value)
+        return self._result("one sample t-test", ttest, p_value, len(feature), {"normal": normal})
         
 
     def twoSampleTtest(self, feature1, feature2, clt = False):
         """
             input:
-                feature1 : Sequence of numeric values
-                feature2 : Another independent sequence of numeric values
+                feature1 : Sequence of numeric values, or its RunningStats summary
+                feature2 : Another independent sequence of numeric values, or its RunningStats summary
                 clt : to apply CLT or not (default False)
             output:
                 True, p_value : When the null hypothesis is rejected.
                 False, p_value : When the null hypothesis is not rejected.
         """
+        if isinstance(feature1, RunningStats) or isinstance(feature2, RunningStats):
+            (n1, mean1, var1), (n2, mean2, var2) = self._summaries(feature1, feature2)
+            equal_var = self._bartlettFromStats((n1, n2), (var1, var2)) > self.significance_level
+            tstats, p_value = stats.ttest_ind_from_stats(mean1, np.sqrt(var1), n1, mean2, np.sqrt(var2), n2,
+                                                         equal_var=equal_var)
+            return self._result("two sample t-test", tstats, p_value, n1 + n2, {"equal_var": equal_var})
+
         # please ensure that feature1 and feature2 are of same size and similar scale
         if len(feature1) != len(feature2):
             raise ValueError("Samples are of different sizes")
         
-        if not self.isNormal(feature1) or not self.isNormal(feature2): # both features should be normal for t-test
+        normal = self.isNormal(feature1) and self.isNormal(feature2)
+        if not normal: # both features should be normal for t-test
             if not clt:  # if don't want to apply clt
                 raise ValueError("Samples are not Normally distributed")
             elif len(feature1) <= 30:  # if len(feature) > 30 clt can be applied
@@ -107,19 +304,31 @@ class TestHypothesis():
 
         tstats, p_value = stats.ttest_ind(feature1, feature2, equal_var=equal_var)
 
-        return self.checkSignificance(p_value)
+        return self._result("two sample t-test", tstats, p_value, len(feature1) + len(feature2),
+                            {"normal": normal, "equal_var": equal_var})
         
-    def pairedTtest(self, feature1, feature2, clt = False):
+    def pairedTtest(self, feature1, feature2 = None, clt = False):
         """
             input:
-                feature1 : Sequence of numeric values
-                feature2 : Another dependent sequence of numeric values
+                feature1 : Sequence of numeric values, or the RunningStats summary of the differences feature1 - feature2
+                feature2 : Another dependent sequence of numeric values (None when feature1 is a summary)
                 clt : to apply CLT or not (default False)
             output:
                 True, p_value : When the null hypothesis is rejected.
                 False, p_value : When the null hypothesis is not rejected.
         """
-        if not self.isNormal(feature1) or not self.isNormal(feature2): # both features should be normal for t-test
+        if isinstance(feature1, RunningStats):  # a paired t-test is a one sample t-test of the differences
+            if feature2 is not None:
+                raise ValueError("Pass only the summary of the differences feature1 - feature2.")
+            (n, mean, var), = self._summaries(feature1)
+            tstat = mean / np.sqrt(var / n)
+            p_value = 2 * stats.t.sf(abs(tstat), n - 1)
+            return self._result("paired t-test", tstat, p_value, n, {})
+        if feature2 is None:
+            raise ValueError("feature2 is required unless feature1 is a summary of the differences.")
+
+        normal = self.isNormal(feature1) and self.isNormal(feature2)
+        if not normal: # both features should be normal for t-test
             if not clt:  # if don't want to apply clt
                 raise ValueError("Samples are not Normally distributed")
             elif len(feature1) <= 30:  # if len(feature) > 30 clt can be applied
@@ -127,17 +336,28 @@ class TestHypothesis():
             
         tstat, p_value = stats.ttest_rel(feature1, feature2)
 
-        return self.checkSignificance(p_value)
+        return self._result("paired t-test", tstat, p_value, len(feature1), {"normal": normal})
         
     def ANOVA(self, *features, clt = False):
         """
             input:
-                features : Sequence of numeric sequences
+                features : Sequence of numeric sequences, or their RunningStats summaries
                 clt : to apply CLT or not (default False)
             output:
                 True, p_value : When the null hypothesis is rejected.
                 False, p_value : When the null hypothesis is not rejected.
         """
+        if any(isinstance(feature, RunningStats) for feature in features):
+            ns, means, variances = (np.array(column) for column in zip(*self._summaries(*features)))
+            total, k = ns.sum(), len(ns)
+            grand_mean = (ns * means).sum() / total
+            between = (ns * (means - grand_mean) ** 2).sum() / (k - 1)
+            within = ((ns - 1) * variances).sum() / (total - k)
+            fstat = between / within
+            p_value = stats.f.sf(fstat, k - 1, total - k)
+            equal_var = self._bartlettFromStats(ns, variances) > self.significance_level
+            return self._result("ANOVA", fstat, p_value, total, {"equal_var": equal_var})
+
         # please ensure that feature1 and feature2 are of same size and similar scale
         n = len(features[0])
         for feature in features:
@@ -145,8 +365,10 @@ class TestHypothesis():
                 warnings.warn("Please ensure all the samples are of same length.\nTry downsampling the larger samples.", category=UserWarning)
                 break
 
+        normal = True
         for feature in features:
             if not self.isNormal(feature): # features should be normal for t-test
+                normal = False
                 if not clt:  # if don't want to apply clt
                     raise ValueError("Sample is not Normally distributed")
                 elif len(feature) <= 30:  # if len(feature) > 30 clt can be applied
@@ -156,8 +378,43 @@ class TestHypothesis():
 
         tstats, p_value = stats.f_oneway(*features)
 
-        return self.checkSignificance(p_value)
+        return self._result("ANOVA", tstats, p_value, sum(len(f) for f in features),
+                            {"normal": normal, "equal_var": equal_var})
         
+    def _summaries(self, *features):
+        """
+            inputs:
+                features : RunningStats summaries or numeric sequences (summarized here)
+            output:
+                list of (n, mean, var) tuples, one per feature
+        """
+        summaries = []
+        for feature in features:
+            if not isinstance(feature, RunningStats):
+                feature = RunningStats.from_values(feature)
+            if np.ndim(feature.n) != 0:
+                raise ValueError("Summaries should describe a single feature, not columns.")
+            n, mean, var = feature.summary()
+            if n < 2:
+                raise ValueError("Each sample needs at least 2 values.")
+            summaries.append((int(n), float(mean), float(var)))
+        return summaries
+
+    def _bartlettFromStats(self, ns, variances):
+        """
+            inputs:
+                ns : sample sizes
+                variances : sample variances
+            output:
+                p_value of Bartlett's test of equal variances
+        """
+        ns, variances = np.asarray(ns, dtype=float), np.asarray(variances, dtype=float)
+        total, k = ns.sum(), len(ns)
+        pooled = ((ns - 1) * variances).sum() / (total - k)
+        numerator = (total - k) * np.log(pooled) - ((ns - 1) * np.log(variances)).sum()
+        denominator = 1 + ((1 / (ns - 1)).sum() - 1 / (total - k)) / (3 * (k - 1))
+        return stats.chi2.sf(numerator / denominator, k - 1)
+
     def mannWhitneyUtest(self, feature1, feature2):
         """
             input:
@@ -174,12 +431,13 @@ class TestHypothesis():
         if abs(len1 - len2) > 0.5 * min(len1, len2):  # features size doesn't make much impact here
             warnings.warn("Warning: Large sample size difference may affect test accuracy!")
 
-        if self.isNormal(feature1) and self.isNormal(feature2):  # if both features are normal it is better to use t-test
+        normal = self.isNormal(feature1) and self.isNormal(feature2)
+        if normal:  # if both features are normal it is better to use t-test
             warnings.warn("Features are normal, Consider using t-test instead")
         
         mstat, p_value = stats.mannwhitneyu(feature1, feature2, alternative="two-sided") # return statistic value and pvalue
 
-        return self.checkSignificance(p_value)
+        return self._result("Mann-Whitney U test", mstat, p_value, len1 + len2, {"normal": normal})
         
     def wilcoxonSignedRanktest(self, feature1, feature2):
         """
@@ -197,12 +455,13 @@ class TestHypothesis():
         if len1 != len2:
             raise ValueError("Sample sizes are different.\nTry using samples with same sizes")
 
-        if self.isNormal(feature1) and self.isNormal(feature2):  # if both features are normal it is better to use t-test
+        normal = self.isNormal(feature1) and self.isNormal(feature2)
+        if normal:  # if both features are normal it is better to use t-test
             warnings.warn("Features are normal, Consider using Paired sample t-test instead")
         
         mstat, p_value = stats.wilcoxon(feature1, feature2, alternative="two-sided") # return statistic value and pvalue
 
-        return self.checkSignificance(p_value)
+        return self._result("Wilcoxon signed-rank test", mstat, p_value, len1, {"normal": normal})
         
     def kruskalWallis(self, *features):
         """
@@ -214,24 +473,27 @@ class TestHypothesis():
         """
         kstats, p_value = stats.kruskal(*features)
 
-        return self.checkSignificance(p_value)
+        return self._result("Kruskal-Wallis test", kstats, p_value, sum(len(f) for f in features), {})
         
-    def chiSquare(self, feature1, feature2):
+    def chiSquare(self, feature1, feature2 = None):
         """
             input:
-                feature1 : Sequence of categorical values
-                feature2 : Another independent sequence of categorical values
+                feature1 : Sequence of categorical values, or a ContingencyTable of both features
+                feature2 : Another independent sequence of categorical values (None when feature1 is a table)
             output:
                 True, p_value : When the null hypothesis is rejected.
                 False, p_value : When the null hypothesis is not rejected.
         """
-        ct = pd.crosstab(feature1, feature2)  # gives a contengency table comparing two features.
+        if isinstance(feature1, ContingencyTable):
+            ct = feature1.table
+        else:
+            ct = pd.crosstab(feature1, feature2)  # gives a contengency table comparing two features.
         
         chi2_stat, p_value, dof, expected = stats.chi2_contingency(ct)
         if (expected < 5).sum() > 0.2 * expected.size:  # when expected frequencies are elss than 5
             raise ValueError("Some expected frequencies are too small, Fisher's test is preferred.")
 
-        return self.checkSignificance(p_value)
+        return self._result("chi-square test", chi2_stat, p_value, ct.to_numpy().sum(), {"expected_frequencies": True})
     
     def fisherExacttest(self, feature1, feature2):
         """
@@ -249,17 +511,29 @@ class TestHypothesis():
 
         ftest, p_value = stats.fisher_exact(ct)
         
-        return self.checkSignificance(p_value)
+        return self._result("Fisher's exact test", ftest, p_value, len(feature1), {})
         
-    def pearsonCorrelation(self, feature1, feature2):
+    def pearsonCorrelation(self, feature1, feature2 = None):
         """
             input:
-                feature1 : Sequence of numeric values
-                feature2 : Another independent sequence of numeric values
+                feature1 : Sequence of numeric values, or CorrelationStats of both features
+                feature2 : Another independent sequence of numeric values (None when feature1 is CorrelationStats)
             output:
                 True, p_value : When the null hypothesis is rejected.
                 False, p_value : When the null hypothesis is not rejected.
         """
+        if isinstance(feature1, CorrelationStats):  # normality can't be checked without the samples
+            n, corr = feature1.n, feature1.r
+            if n < 3:
+                raise ValueError("At least 3 pairs are needed.")
+            if np.isnan(corr):
+                raise ValueError("Variance of feature should not be 0.\nTry using Spearman Correlation instead.")
+            corr = min(1.0, max(-1.0, corr))
+            with np.errstate(divide="ignore"):
+                tstat = corr * np.sqrt((n - 2) / (1 - corr ** 2))
+            p_value = 2 * stats.t.sf(abs(tstat), n - 2)
+            return self._result("Pearson correlation", corr, p_value, n, {})
+
         if len(feature1) != len(feature2): # lenghts should be equal to use pearson Correlation
             raise ValueError("Sample lenghts are not equal.\nTry using downsampling methods.")
         
@@ -271,7 +545,7 @@ class TestHypothesis():
         
         corr, p_value = stats.pearsonr(feature1, feature2)
 
-        return self.checkSignificance(p_value)
+        return self._result("Pearson correlation", corr, p_value, len(feature1), {"normal": True})
         
     def spearmanCorrelation(self, feature1, feature2):
         """
@@ -287,4 +561,124 @@ class TestHypothesis():
         
         corr, p_value = stats.spearmanr(feature1, feature2)
 
-        return self.checkSignificance(p_value)
\ No newline at end of file
+        return self._result("Spearman correlation", corr, p_value, len(feature1), {})
+
+    def _asMatrix(self, data):
+        """
+            inputs:
+                data : DataFrame, 2-D array or 1-D sequence (one feature per column)
+            output:
+                float 2-D array of shape (samples, features), missing values as NaN
+        """
+        matrix = np.asarray(data, dtype=float)
+        if matrix.ndim == 1:
+            matrix = matrix[:, None]
+        if matrix.ndim != 2:
+            raise ValueError("Data should be a 2-D array with one feature per column.")
+        return matrix
+
+    def _columnStats(self, matrix):
+        """
+            inputs:
+                matrix : float 2-D array, one feature per column
+            output:
+                n, mean, var : per column count, mean and sample variance, ignoring NaN
+        """
+        n = np.sum(~np.isnan(matrix), axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nansum(matrix, axis=0) / n
+            var = np.nansum((matrix - mean) ** 2, axis=0) / (n - 1)
+        return n, mean, var
+
+    def batchOneSampleTtest(self, data, meu):
+        """
+            Runs a one sample t-test on every column of data in one vectorized pass.
+            Assumption checks are not run here, use isNormal on the columns of interest.
+
+            inputs:
+                data : DataFrame or 2-D array, one feature (sample) per column
+                meu : Population mean, a scalar or one value per column
+            output:
+                rejected : bool array, True where the null hypothesis is rejected
+                p_values : array of p values
+                statistics : array of t statistics
+        """
+        n, mean, var = self._columnStats(self._asMatrix(data))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            statistics = (mean - np.asarray(meu, dtype=float)) / np.sqrt(var / n)
+        p_values = 2 * stats.t.sf(np.abs(statistics), n - 1)
+        rejected = p_values < self.significance_level
+
+        if self.quiet and self.collect_results:
+            self.results.extend("one sample t-test", statistics, p_values, rejected, n, {})
+        return rejected, p_values, statistics
+
+    def batchTwoSampleTtest(self, data1, data2, equal_var = None):
+        """
+            Runs an independent two sample t-test on every pair of columns in one vectorized pass.
+            Assumption checks are not run here, use isNormal on the columns of interest.
+
+            inputs:
+                data1 : DataFrame or 2-D array, one feature per column
+                data2 : Another independent DataFrame or 2-D array with the same columns
+                        (DataFrames are matched by column name)
+                equal_var : True for Student's t-test, False for Welch's t-test,
+                            None to choose per column with Levene's test like twoSampleTtest (default None)
+            output:
+                rejected : bool array, True where the null hypothesis is rejected
+                p_values : array of p values
+                statistics : array of t statistics
+        """
+        if isinstance(data1, pd.DataFrame) and isinstance(data2, pd.DataFrame):
+            data2 = data2[data1.columns]
+        x, y = self._asMatrix(data1), self._asMatrix(data2)
+        if x.shape[1] != y.shape[1]:
+            raise ValueError("Both samples should have the same number of features.")
+
+        n1, mean1, var1 = self._columnStats(x)
+        n2, mean2, var2 = self._columnStats(y)
+
+        checked = equal_var is None  # a forced equal_var is not an assumption check
+        if checked:
+            equal_var = self._batchLevene(x, y) > self.significance_level
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Student: pooled variance, n1 + n2 - 2 degrees of freedom
+            pooled = ((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2)
+            se_pooled = np.sqrt(pooled * (1 / n1 + 1 / n2))
+            # Welch: separate variances, Welch-Satterthwaite degrees of freedom
+            v1, v2 = var1 / n1, var2 / n2
+            se_welch = np.sqrt(v1 + v2)
+            df_welch = (v1 + v2) ** 2 / (v1 ** 2 / (n1 - 1) + v2 ** 2 / (n2 - 1))
+
+            se = np.where(equal_var, se_pooled, se_welch)
+            dof = np.where(equal_var, n1 + n2 - 2, df_welch)
+            statistics = (mean1 - mean2) / se
+        p_values = 2 * stats.t.sf(np.abs(statistics), dof)
+        rejected = p_values < self.significance_level
+
+        if self.quiet and self.collect_results:
+            self.results.extend("two sample t-test", statistics, p_values, rejected, n1 + n2,
+                                {"equal_var": equal_var} if checked else {})
+        return rejected, p_values, statistics
+
+    def _batchLevene(self, x, y):
+        """
+            inputs:
+                x, y : float 2-D arrays with the same number of columns
+            output:
+                array of p values of Levene's test (median centered, as in scipy) for every column
+        """
+        z1 = np.abs(x - np.nanmedian(x, axis=0))
+        z2 = np.abs(y - np.nanmedian(y, axis=0))
+        n1, mean1, var1 = self._columnStats(z1)
+        n2, mean2, var2 = self._columnStats(z2)
+
+        n = n1 + n2
+        with np.errstate(invalid="ignore", divide="ignore"):
+            grand = (n1 * mean1 + n2 * mean2) / n
+            between = n1 * (mean1 - grand) ** 2 + n2 * (mean2 - grand) ** 2
+            within = (n1 - 1) * var1 + (n2 - 1) * var2
+            w = (n - 2) * between / within
+        return stats.f.sf(w, 1, n - 2)
@@ -0,0 +1,123 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+
+MANIFEST = 'columns.json'
+
+
+def write_store(data, directory, exact=False):
+    """
+    Writes a DataFrame as one contiguous .npy file per column plus a manifest.
+
+    Numeric, boolean and datetime columns are saved as they are. String and
+    categorical columns are saved as integer codes, with their categories
+    kept in the manifest. A non-default index is saved like a column.
+
+    Parameters:
+        - data (pd.DataFrame): Dataset to write.
+        - directory (str): Target directory, created if missing.
+        - exact (bool): Raise ValueError instead of storing a nullable extension column
+          as its numpy equivalent, so read_store returns the same dtypes (default: False).
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    entries = []
+    for i, (name, series) in enumerate(data.items()):
+        entries.append(_write_column(series, directory, f"{i}.npy", name, exact))
+
+    manifest = {'rows': len(data), 'columns': entries, 'index': None, 'column_names': list(data.columns.names)}
+    if not isinstance(data.index, pd.RangeIndex) or data.index.start != 0 or data.index.step != 1:
+        if isinstance(data.index, pd.MultiIndex):
+            raise ValueError("A MultiIndex cannot be memory-mapped.")
+        manifest['index'] = _write_column(data.index.to_series(), directory, 'index.npy', data.index.name, exact)
+
+    tmp_path = os.path.join(directory, f"{MANIFEST}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, os.path.join(directory, MANIFEST))  # the store is complete once its manifest exists
+
+
+def _write_column(series, directory, filename, name, exact=False):
+    entry = {'name': name, 'file': filename}
+    if isinstance(name, tuple):  # JSON turns tuples (MultiIndex labels) into lists
+        entry['tuple'] = True
+    if isinstance(series.dtype, pd.SparseDtype):  # a dense .npy file would defeat the sparse layout
+        raise ValueError(f"Column {name!r} of dtype {series.dtype} cannot be memory-mapped.")
+    if isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(series):
+        categorical = pd.Categorical(series)
+        entry.update(kind='category', categories=categorical.categories.tolist(), ordered=bool(categorical.ordered),
+                     strings=None if isinstance(series.dtype, pd.CategoricalDtype) else str(series.dtype))
+        values = categorical.codes
+    elif pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_dtype(series) \
+            or pd.api.types.is_timedelta64_dtype(series):
+        if exact and isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            raise ValueError(f"Column {name!r} of dtype {series.dtype} cannot be memory-mapped exactly.")
+        entry['kind'] = 'numpy'
+        values = series.to_numpy()
+        if values.dtype == object:  # nullable extension types, store their numpy equivalent
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+    else:
+        raise ValueError(f"Column {name!r} of dtype {series.dtype} cannot be memory-mapped.")
+
+    np.save(os.path.join(directory, filename), np.ascontiguousarray(values))
+    return entry
+
+
+def read_store(directory, usecols=None, categorize_strings=True):
+    """
+    Opens a store written by write_store without reading or copying the data.
+
+    Every column is a copy-on-write np.memmap: processes opening the same
+    store share the pages of the OS page cache, and writes to a column stay
+    private to the process instead of changing the files.
+
+    Parameters:
+        - directory (str): Directory of the store.
+        - usecols (list): Columns to open (default: None, opens all).
+        - categorize_strings (bool): Return string columns as memory-mapped categoricals; when False
+          they are rebuilt as strings, which copies them (default: True).
+
+    Returns:
+        - pd.DataFrame: Dataset backed by the memory-mapped files.
+    """
+    with open(os.path.join(directory, MANIFEST)) as f:
+        manifest = json.load(f)
+
+    entries = manifest['columns']
+    if usecols is not None:
+        usecols = list(usecols)
+        names = [_entry_name(entry) for entry in entries]
+        missing = [col for col in usecols if col not in names]
+        if missing:
+            raise ValueError(f"Columns not found in the store: {sorted(missing, key=str)}")
+        entries = [entry for entry, name in zip(entries, names) if name in usecols]
+
+    # built by position: names may repeat, and the manifest cannot key a dict by them
+    arrays = [_read_column(directory, entry, categorize_strings) for entry in entries]
+    index = None
+    if manifest['index'] is not None:
+        index = pd.Index(_read_column(directory, manifest['index'], categorize_strings),
+                         name=_entry_name(manifest['index']), copy=False)
+    data = pd.DataFrame(dict(enumerate(arrays)), index=index if index is not None else pd.RangeIndex(manifest['rows']),
+                        copy=False)
+    if entries:
+        data.columns = pd.Index([_entry_name(entry) for entry in entries], tupleize_cols=True)
+        names = manifest.get('column_names')
+        if names is not None and len(names) == data.columns.nlevels:
+            data.columns.names = names
+    return data
+
+
+def _entry_name(entry):
+    name = entry['name']
+    return tuple(name) if entry.get('tuple') else name
+
+
+def _read_column(directory, entry, categorize_strings=True):
+    values = np.load(os.path.join(directory, entry['file']), mmap_mode='c')
+    if entry['kind'] == 'category':
+        values = pd.Categorical.from_codes(values, categories=entry['categories'], ordered=entry['ordered'])
+        if entry.get('strings') and not categorize_strings:
+            values = pd.Series(np.asarray(values), dtype=entry['strings']).array
+    return values
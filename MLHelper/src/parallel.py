@@ -0,0 +1,47 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+def default_workers(n_tasks=None):
+    """
+    Returns the number of worker processes to use, at most one per task.
+    """
+    workers = os.cpu_count() or 1
+    if n_tasks is not None:
+        workers = min(workers, n_tasks)
+    return max(workers, 1)
+
+
+def ordered_map(func, tasks, workers=None, max_pending=None):
+    """
+    Runs func over tasks in a process pool and yields the results in task order.
+
+    At most max_pending tasks are submitted ahead of the consumer, so results
+    that are produced but not yet consumed stay bounded in memory.
+
+    Parameters:
+        - func (callable): Module level (picklable) function called as func(*task).
+        - tasks (iterable): Argument tuples, one per call.
+        - workers (int): Number of worker processes (default: None, one per CPU).
+        - max_pending (int): Tasks in flight at once (default: None, twice the workers).
+
+    Yields:
+        - Results of func, in the order of tasks.
+    """
+    tasks = iter(tasks)
+    workers = workers or default_workers()
+    max_pending = max_pending or 2 * workers
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        try:
+            for task in tasks:
+                pending.append(pool.submit(func, *task))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:  # consumer stopped early or a task failed
+            for future in pending:
+                future.cancel()
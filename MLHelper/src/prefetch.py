@@ -0,0 +1,156 @@
+import queue
+import threading
+import time
+import weakref
+
+_DONE = object()  # end-of-stream marker put on the queue by the producer
+
+
+class _Failure:
+    """
+    Carries an exception from the producer thread to the consumer.
+    """
+
+    def __init__(self, error):
+        self.error = error
+
+
+def _produce(iterator, items, stop, counters):
+    """
+    Body of the producer thread. It holds no reference to the PrefetchIterator,
+    so an abandoned iterator can be garbage collected, which stops the thread.
+    """
+    try:
+        for item in iterator:
+            if not _put(items, item, stop, counters):
+                return
+        _put(items, _DONE, stop, counters)
+    except Exception as e:
+        _put(items, _Failure(e), stop, counters)
+    finally:  # closes e.g. the pandas reader of a chunk generator, from the thread running it
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+
+
+def _put(items, item, stop, counters):
+    """
+    Waits for queue space, giving up when the iterator is closed.
+    """
+    start = time.perf_counter()
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            counters['producer_wait_time'] += time.perf_counter() - start
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _stop(items, stop):
+    """
+    Tells the producer thread to finish and drops the prefetched items.
+    """
+    stop.set()
+    while True:
+        try:
+            items.get_nowait()
+        except queue.Empty:
+            break
+
+
+class PrefetchIterator:
+    """
+    Iterates over another iterator while a background thread produces the
+    next items ahead of the consumer.
+
+    While the consumer works on chunk N, the thread is already parsing chunk
+    N+1. The queue between them holds at most depth items, which keeps memory
+    bounded. Parsing can overlap with the consumer's work because pandas
+    releases the GIL while tokenizing.
+
+    Metrics:
+        - chunks: Items handed to the consumer.
+        - stall_time: Seconds the consumer waited for an item (the producer was behind).
+        - producer_wait_time: Seconds the producer waited for queue space (the consumer was behind).
+        - mean_queue_depth: Average number of ready items when the consumer asked for one.
+    """
+
+    def __init__(self, iterable, depth=1):
+        """
+        Parameters:
+            - iterable (iterable): Source of the items, consumed in the background thread.
+            - depth (int): Maximum number of items produced ahead (default: 1, double buffering).
+        """
+        if depth <= 0:
+            raise ValueError("depth should be a positive integer.")
+
+        self.depth = depth
+        self.chunks = 0
+        self.stall_time = 0.0
+        self._counters = {'producer_wait_time': 0.0}  # written by the producer thread
+        self._depth_total = 0
+        self._finished = False
+        self._queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=_produce, args=(iter(iterable), self._queue, self._stop, self._counters),
+                                        daemon=True)
+        self._thread.start()
+        # stops the thread when the iterator is dropped without close(), e.g. after a break out of a for loop
+        self._finalizer = weakref.finalize(self, _stop, self._queue, self._stop)
+
+    @property
+    def producer_wait_time(self):
+        return self._counters['producer_wait_time']
+
+    @property
+    def mean_queue_depth(self):
+        return self._depth_total / self.chunks if self.chunks else 0.0
+
+    def stats(self):
+        """
+        Returns the prefetch metrics as a dict.
+        """
+        return {
+            'chunks': self.chunks,
+            'stall_time': self.stall_time,
+            'producer_wait_time': self.producer_wait_time,
+            'mean_queue_depth': self.mean_queue_depth,
+        }
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._finished:
+            raise StopIteration
+
+        self._depth_total += self._queue.qsize()
+        start = time.perf_counter()
+        item = self._queue.get()
+        self.stall_time += time.perf_counter() - start
+
+        if item is _DONE or isinstance(item, _Failure):
+            self._finished = True
+            self._thread.join()
+            if item is _DONE:
+                raise StopIteration
+            raise item.error
+
+        self.chunks += 1
+        return item
+
+    def close(self):
+        """
+        Stops the background thread and drops any prefetched items.
+        """
+        self._finished = True
+        self._finalizer()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,112 @@
+import itertools
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+import pandas as pd
+from .mmap_store import read_store, write_store
+
+
+class DatasetRegistry:
+    """
+    Named datasets held under a memory budget.
+
+    When the datasets in memory exceed the budget, the least recently used
+    ones are spilled to disk as memory-mappable column stores (pickle for
+    dtypes the store cannot hold) and are read back on their next access.
+    """
+
+    def __init__(self, memory_budget=None, spill_dir=None):
+        """
+        Parameters:
+            - memory_budget (int): Bytes of datasets kept in memory (default: None, unlimited).
+            - spill_dir (str): Directory for spilled datasets (default: None, a temporary directory).
+        """
+        if memory_budget is not None and memory_budget <= 0:
+            raise ValueError("memory_budget should be a positive integer.")
+
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.frames = OrderedDict()  # name -> (DataFrame, bytes), least recently used first
+        self.spilled = {}  # name -> path of the spilled copy
+        self._counter = itertools.count()
+
+    def __contains__(self, name):
+        return name in self.frames or name in self.spilled
+
+    def names(self):
+        """
+        Returns the names of all datasets, in memory or spilled.
+        """
+        return list(self.frames) + [name for name in self.spilled if name not in self.frames]
+
+    def memory_usage(self):
+        """
+        Returns the bytes used by the datasets held in memory.
+        """
+        return sum(size for _, size in self.frames.values())
+
+    def add(self, name, data):
+        """
+        Stores a dataset under name, replacing any dataset with the same name.
+        """
+        self.remove(name)
+        self.frames[name] = (data, int(data.memory_usage(deep=True).sum()))
+        self._evict()
+
+    def get(self, name):
+        """
+        Returns a dataset, reading it back from disk if it was spilled.
+        """
+        if name in self.frames:
+            self.frames.move_to_end(name)
+            return self.frames[name][0]
+        if name not in self.spilled:
+            raise ValueError(f"No dataset named {name!r}. Loaded datasets: {self.names()}")
+
+        path = self.spilled[name]
+        data = pd.read_pickle(path) if path.endswith('.pkl') else read_store(path, categorize_strings=False)
+        del self.spilled[name]  # only once the copy was read, a failed read keeps the dataset registered
+        self._delete(path)
+        self.add(name, data)
+        return data
+
+    def remove(self, name):
+        """
+        Forgets a dataset and deletes its spilled copy.
+        """
+        self.frames.pop(name, None)
+        path = self.spilled.pop(name, None)
+        if path is not None:
+            self._delete(path)
+
+    def _evict(self):
+        """
+        Spills least recently used datasets until the rest fits the budget.
+        The most recently used dataset always stays in memory.
+        """
+        if self.memory_budget is None:
+            return
+        while len(self.frames) > 1 and self.memory_usage() > self.memory_budget:
+            name, (data, _) = self.frames.popitem(last=False)
+            self.spilled[name] = self._spill(data)
+
+    def _spill(self, data):
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix='mlhelper-spill-')
+        # a fresh path every time: the previous copy may still be memory-mapped by this dataset
+        path = os.path.join(self.spill_dir, f"dataset-{os.getpid()}-{next(self._counter)}")
+        try:
+            write_store(data, path, exact=True)
+        except (ValueError, TypeError):  # dtype or label the column store cannot give back exactly
+            shutil.rmtree(path, ignore_errors=True)
+            path += '.pkl'
+            data.to_pickle(path)
+        return path
+
+    @staticmethod
+    def _delete(path):
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,175 @@
+from .hypothesis_testing import TestHypothesis
+from .summary_stats import ContingencyTable, CorrelationStats, GroupedStats, RunningStats
+
+
+class StreamingTests:
+    """
+    Runs hypothesis tests over a dataset too large for memory in one pass over its chunks.
+
+    Tests are declared first, then the chunks (from DataLoader.stream_csv,
+    pd.read_csv(chunksize=...) or any iterable of DataFrames) are fed once.
+    Every test keeps only a mergeable accumulator (RunningStats, GroupedStats,
+    CorrelationStats or ContingencyTable), so memory does not grow with the
+    data. Runners over different shards with the same tests can be merged.
+    The tests are finally computed by TestHypothesis from the accumulated
+    statistics.
+
+    Example:
+        runner = StreamingTests(TestHypothesis(quiet=True))
+        runner.twoSampleTtest('revenue', by='variant', groups=('A', 'B'))
+        runner.chiSquare('variant', 'converted')
+        results = runner.run(loader.stream_csv('experiment.csv'))
+    """
+
+    def __init__(self, tester=None):
+        """
+        Parameters:
+            - tester (TestHypothesis): Tester computing the tests, which sets the significance level
+              and quiet mode (default: None, TestHypothesis()).
+        """
+        self.tester = tester if tester is not None else TestHypothesis()
+        self.tests = []  # (method, columns, options, accumulator) in the order the tests were declared
+
+    def _add(self, method, columns, options, accumulator):
+        self.tests.append((method, columns, options, accumulator))
+        return self
+
+    def OneSampleTtest(self, column, meu):
+        """
+        Declares a one sample t-test of column against the population mean meu.
+        """
+        return self._add('OneSampleTtest', (column,), {'meu': meu}, RunningStats())
+
+    def twoSampleTtest(self, column1, column2=None, by=None, groups=None):
+        """
+        Declares an independent two sample t-test, either between two columns,
+        or of column1 between the two groups of the column by.
+
+        Parameters:
+            - column1 (str): First sample, or the value column when by is given.
+            - column2 (str): Second sample (default: None).
+            - by (str): Column holding the group of every row (default: None).
+            - groups (tuple): The two groups to compare (default: None, the column by must hold exactly two).
+        """
+        if by is None:
+            if column2 is None:
+                raise ValueError("Give either two columns or a column and by.")
+            return self._add('twoSampleTtest', (column1, column2), {}, (RunningStats(), RunningStats()))
+        return self._add('twoSampleTtest', (column1, by), {'groups': groups}, GroupedStats())
+
+    def pairedTtest(self, column1, column2):
+        """
+        Declares a paired t-test between two columns, accumulated over their differences.
+        """
+        return self._add('pairedTtest', (column1, column2), {}, RunningStats())
+
+    def ANOVA(self, *columns, by=None):
+        """
+        Declares a one-way ANOVA, either between several columns, or of a single
+        column between all the groups of the column by.
+        """
+        if by is None:
+            if len(columns) < 2:
+                raise ValueError("Give at least two columns or a column and by.")
+            return self._add('ANOVA', columns, {}, tuple(RunningStats() for _ in columns))
+        if len(columns) != 1:
+            raise ValueError("Give a single value column with by.")
+        return self._add('ANOVA', (columns[0], by), {'groups': None}, GroupedStats())
+
+    def chiSquare(self, column1, column2):
+        """
+        Declares a chi-square test of independence, counting the contingency table chunk by chunk.
+        """
+        return self._add('chiSquare', (column1, column2), {}, ContingencyTable())
+
+    def pearsonCorrelation(self, column1, column2):
+        """
+        Declares a test of Pearson's correlation between two columns.
+        """
+        return self._add('pearsonCorrelation', (column1, column2), {}, CorrelationStats())
+
+    def update(self, chunk):
+        """
+        Adds one chunk (pd.DataFrame) to the accumulators of every declared test.
+        """
+        for method, columns, options, accumulator in self.tests:
+            if isinstance(accumulator, tuple):  # one RunningStats per column
+                for column, stats in zip(columns, accumulator):
+                    stats.update(chunk[column])
+            elif isinstance(accumulator, GroupedStats):
+                accumulator.update(chunk[columns[1]], chunk[columns[0]])
+            elif method == 'pairedTtest':
+                accumulator.update(chunk[columns[0]].to_numpy(dtype=float) - chunk[columns[1]].to_numpy(dtype=float))
+            elif len(columns) == 2:  # CorrelationStats and ContingencyTable
+                accumulator.update(chunk[columns[0]], chunk[columns[1]])
+            else:
+                accumulator.update(chunk[columns[0]])
+        return self
+
+    def merge(self, other):
+        """
+        Folds the accumulators of another runner with the same declared tests
+        (e.g. one that ran over another shard) into this one.
+        """
+        if [test[:3] for test in self.tests] != [test[:3] for test in other.tests]:
+            raise ValueError("Both runners should declare the same tests in the same order.")
+
+        for (_, _, _, accumulator), (_, _, _, theirs) in zip(self.tests, other.tests):
+            if isinstance(accumulator, tuple):
+                for mine, stats in zip(accumulator, theirs):
+                    mine.merge(stats)
+            else:
+                accumulator.merge(theirs)
+        return self
+
+    def run(self, chunks):
+        """
+        Feeds every chunk once and computes the declared tests.
+
+        Parameters:
+            - chunks (iterable): pd.DataFrame chunks of the dataset.
+
+        Returns:
+            - list: Result of every test in declaration order, as returned by TestHypothesis
+              (a TestResult in quiet mode).
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self.results()
+
+    def results(self):
+        """
+        Computes the declared tests from the statistics accumulated so far.
+        """
+        return [self._compute(*test) for test in self.tests]
+
+    def _compute(self, method, columns, options, accumulator):
+        tester = self.tester
+        if method == 'OneSampleTtest':
+            return tester.OneSampleTtest(accumulator, options['meu'])
+        if method == 'pairedTtest':
+            return tester.pairedTtest(accumulator)
+        if method == 'chiSquare':
+            return tester.chiSquare(accumulator)
+        if method == 'pearsonCorrelation':
+            return tester.pearsonCorrelation(accumulator)
+
+        samples = accumulator if isinstance(accumulator, tuple) else self._groupSamples(accumulator, options['groups'],
+                                                                                       method, columns[1])
+        if method == 'twoSampleTtest':
+            return tester.twoSampleTtest(*samples)
+        return tester.ANOVA(*samples)
+
+    @staticmethod
+    def _groupSamples(accumulator, groups, method, by):
+        """
+        Returns the RunningStats of the requested groups (all groups, sorted, when None).
+        """
+        if groups is None:
+            groups = sorted(accumulator.groups, key=str)
+        missing = [group for group in groups if group not in accumulator.groups]
+        if missing:
+            raise ValueError(f"Groups not found in column {by!r}: {missing}")
+        if method == 'twoSampleTtest' and len(groups) != 2:
+            raise ValueError(f"A two sample t-test needs exactly 2 groups, column {by!r} has {len(groups)}.")
+        return [accumulator.groups[group] for group in groups]
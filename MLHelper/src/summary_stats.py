@@ -0,0 +1,229 @@
+import numpy as np
+import pandas as pd
+
+
+class RunningStats:
+    """
+    Mergeable count, mean and sum of squared deviations of a sample.
+
+    Values are added chunk by chunk: each chunk is reduced with NumPy and
+    folded into the running totals with Chan's parallel update, which is as
+    numerically stable as Welford's one-at-a-time update. Accumulators built
+    over separate chunks, files or worker processes merge into the statistics
+    of the combined sample, so the samples themselves are never kept.
+
+    A 2-D chunk is reduced per column, giving per-column statistics. NaN
+    values are skipped.
+    """
+
+    def __init__(self, n=0, mean=0.0, m2=0.0):
+        """
+        Parameters:
+            - n (int/np.ndarray): Number of values (default: 0).
+            - mean (float/np.ndarray): Mean of the values (default: 0.0).
+            - m2 (float/np.ndarray): Sum of squared deviations from the mean (default: 0.0).
+        """
+        self.n = np.asarray(n, dtype=np.int64)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.m2 = np.asarray(m2, dtype=np.float64)
+
+    @classmethod
+    def from_summary(cls, n, mean, var):
+        """
+        Builds an accumulator from precomputed summary statistics.
+
+        Parameters:
+            - n (int/np.ndarray): Sample size.
+            - mean (float/np.ndarray): Sample mean.
+            - var (float/np.ndarray): Sample variance (ddof=1).
+        """
+        n = np.asarray(n, dtype=np.int64)
+        return cls(n, mean, np.asarray(var, dtype=np.float64) * np.maximum(n - 1, 0))
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Builds an accumulator over a sample (1-D) or over the columns of a 2-D array.
+        """
+        return cls().update(values)
+
+    @property
+    def var(self):
+        """
+        Sample variance (ddof=1), NaN below two values.
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.n > 1, self.m2 / np.maximum(self.n - 1, 1), np.nan)[()]
+
+    @property
+    def std(self):
+        return np.sqrt(self.var)
+
+    def summary(self):
+        """
+        Returns the (n, mean, var) summary of the sample.
+        """
+        return self.n[()], self.mean[()], self.var
+
+    def update(self, values):
+        """
+        Adds a chunk of values and returns the accumulator.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 0:
+            values = values.reshape(1)
+
+        valid = ~np.isnan(values)
+        n = valid.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(n > 0, np.where(valid, values, 0.0).sum(axis=0) / np.maximum(n, 1), 0.0)
+        m2 = np.where(valid, (values - mean) ** 2, 0.0).sum(axis=0)
+        return self._combine(n, mean, m2)
+
+    def merge(self, other):
+        """
+        Folds the statistics of another accumulator into this one and returns it.
+        """
+        return self._combine(other.n, other.mean, other.m2)
+
+    def _combine(self, n, mean, m2):
+        """
+        Chan et al. update of (n, mean, m2) with the statistics of another sample.
+        """
+        total = self.n + n
+        delta = mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            share = np.where(total > 0, n / np.maximum(total, 1), 0.0)
+        self.mean = self.mean + delta * share
+        self.m2 = self.m2 + m2 + delta ** 2 * self.n * share
+        self.n = total
+        return self
+
+    def copy(self):
+        return RunningStats(self.n.copy(), self.mean.copy(), self.m2.copy())
+
+    def __add__(self, other):
+        return self.copy().merge(other)
+
+    def __repr__(self):
+        return f"RunningStats(n={self.n[()]!r}, mean={self.mean[()]!r}, var={self.var!r})"
+
+
+class GroupedStats:
+    """
+    RunningStats of a value for every group of a key, discovered while streaming.
+    """
+
+    def __init__(self):
+        self.groups = {}  # group key -> RunningStats
+
+    def update(self, keys, values):
+        """
+        Adds a chunk of (key, value) pairs and returns the accumulator.
+        """
+        frame = pd.DataFrame({'key': np.asarray(keys), 'value': np.asarray(values, dtype=np.float64)})
+        agg = frame.dropna().groupby('key', sort=False)['value'].agg(['count', 'mean', 'var'])
+        for key, count, mean, var in zip(agg.index, agg['count'], agg['mean'], agg['var'].fillna(0.0)):
+            self._group(key).merge(RunningStats.from_summary(count, mean, var))
+        return self
+
+    def merge(self, other):
+        """
+        Folds the groups of another accumulator into this one and returns it.
+        """
+        for key, group in other.groups.items():
+            self._group(key).merge(group)
+        return self
+
+    def _group(self, key):
+        if key not in self.groups:
+            self.groups[key] = RunningStats()
+        return self.groups[key]
+
+
+class CorrelationStats:
+    """
+    Mergeable statistics of paired values for Pearson's correlation: count,
+    means, sums of squared deviations and the co-moment, updated with Chan's
+    parallel formulas. Pairs with a missing value are skipped.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = self.mean_y = 0.0
+        self.m2_x = self.m2_y = self.c_xy = 0.0
+
+    def update(self, x, y):
+        """
+        Adds a chunk of pairs and returns the accumulator.
+        """
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        valid = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[valid], y[valid]
+        if len(x) == 0:
+            return self
+
+        other = CorrelationStats()
+        other.n = len(x)
+        other.mean_x, other.mean_y = x.mean(), y.mean()
+        dx, dy = x - other.mean_x, y - other.mean_y
+        other.m2_x, other.m2_y, other.c_xy = dx @ dx, dy @ dy, dx @ dy
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+        Folds the statistics of another accumulator into this one and returns it.
+        """
+        total = self.n + other.n
+        if total == 0:
+            return self
+        share = other.n / total
+        dx, dy = other.mean_x - self.mean_x, other.mean_y - self.mean_y
+        self.m2_x += other.m2_x + dx * dx * self.n * share
+        self.m2_y += other.m2_y + dy * dy * self.n * share
+        self.c_xy += other.c_xy + dx * dy * self.n * share
+        self.mean_x += dx * share
+        self.mean_y += dy * share
+        self.n = total
+        return self
+
+    @property
+    def r(self):
+        """
+        Pearson's correlation coefficient, NaN when a variance is 0.
+        """
+        denominator = np.sqrt(self.m2_x * self.m2_y)
+        return self.c_xy / denominator if denominator > 0 else np.nan
+
+
+class ContingencyTable:
+    """
+    Counts of every (row value, column value) pair, built chunk by chunk.
+    Missing values are not counted, as in pd.crosstab.
+    """
+
+    def __init__(self):
+        self.counts = pd.DataFrame(dtype=np.int64)
+
+    def update(self, rows, columns):
+        """
+        Adds a chunk of paired categorical values and returns the accumulator.
+        """
+        return self._add(pd.crosstab(np.asarray(rows), np.asarray(columns)))
+
+    def merge(self, other):
+        """
+        Adds the counts of another table and returns this one.
+        """
+        return self._add(other.counts)
+
+    def _add(self, counts):
+        self.counts = self.counts.add(counts, fill_value=0).fillna(0).astype(np.int64)
+        return self
+
+    @property
+    def table(self):
+        """
+        The counts as a DataFrame, rows and columns sorted by value.
+        """
+        return self.counts.sort_index().sort_index(axis=1)
@@ -0,0 +1,488 @@
+import asyncio
+import gc
+import gzip
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.async_loader import AsyncDataLoader
+from src.cache import ParseCache
+from src.csv_index import CsvIndex
+from src.data_loader import DataLoader
+from src.mmap_store import read_store, write_store
+from src.registry import DatasetRegistry
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 3000
+    return pd.DataFrame({
+        'id': np.arange(n),
+        'region': rng.choice(['EU', 'US', 'APAC'], n, p=[0.6, 0.3, 0.1]),
+        'value': rng.normal(0, 1, n).round(6),
+        'note': [f'line "{i}"\nsecond, part' if i % 7 == 0 else f'n{i}' for i in range(n)],
+    })
+
+
+@pytest.fixture
+def csv_file(tmp_path, frame):
+    path = str(tmp_path / 'data.csv')
+    frame.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def loader():
+    return DataLoader()
+
+
+def test_stream_csv_matches_read_csv(loader, csv_file, tmp_path):
+    chunks = list(loader.stream_csv(csv_file, chunksize=700))
+    assert len(chunks) == 5
+    pd.testing.assert_frame_equal(pd.concat(chunks), pd.read_csv(csv_file))
+
+    chunks = list(loader.stream_csv(csv_file, chunk_bytes=20000))
+    assert len(chunks) > 1
+    pd.testing.assert_frame_equal(pd.concat(chunks), pd.read_csv(csv_file))
+
+    with pytest.raises(RuntimeError, match='Error loading CSV'):
+        loader.stream_csv(str(tmp_path / 'missing.csv'))
+
+
+def test_parse_cache_hit_and_invalidation(tmp_path, csv_file):
+    pytest.importorskip('pyarrow')
+    loader = DataLoader(cache_dir=str(tmp_path / 'cache'))
+    first = loader.load_csv(csv_file)
+    assert len(os.listdir(tmp_path / 'cache')) == 1
+    pd.testing.assert_frame_equal(loader.load_csv(csv_file), first)
+
+    loader.load_csv(csv_file, optimize_memory=True)
+    assert loader.memory_report is not None
+    loader.load_csv(csv_file, optimize_memory=True)
+    assert loader.memory_report is None  # a cached parse has no before/after figures
+
+    cache = loader.cache
+    assert cache.entry_path(csv_file, {'sep': ','}) != cache.entry_path(csv_file, {'sep': ';'})
+    before = cache.entry_path(csv_file, {'sep': ','})
+    with open(csv_file, 'a') as f:
+        f.write('3000,EU,1.5,x\n')
+    assert cache.entry_path(csv_file, {'sep': ','}) != before
+    assert len(loader.load_csv(csv_file)) == len(first) + 1
+
+
+def test_parse_cache_evicts_least_recently_used(tmp_path, csv_file):
+    pytest.importorskip('pyarrow')
+    data = pd.read_csv(csv_file)
+    cache = ParseCache(str(tmp_path / 'cache'))
+    for sep in ('a', 'b', 'c'):
+        cache.put(csv_file, {'sep': sep}, data)
+        time.sleep(0.01)
+    entry_size = os.path.getsize(cache.entry_path(csv_file, {'sep': 'a'}))
+    cache.get(csv_file, {'sep': 'a'})  # most recently used now
+
+    cache.max_bytes = int(entry_size * 2.5)
+    cache._evict()
+    assert os.path.exists(cache.entry_path(csv_file, {'sep': 'a'}))
+    assert not os.path.exists(cache.entry_path(csv_file, {'sep': 'b'}))
+    assert cache.size() <= cache.max_bytes
+
+
+@pytest.mark.parametrize('kind', ['parquet', 'feather'])
+def test_columnar_projection_and_filters(loader, tmp_path, frame, kind):
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path / f'data.{kind}')
+    if kind == 'parquet':
+        frame.to_parquet(path, index=False, row_group_size=500)
+    else:
+        frame.to_feather(path)
+
+    load = getattr(loader, f'load_{kind}')
+    data = load(path, usecols=['value'], filters=[('region', '==', 'EU'), ('value', '>', 0)], index_col='id')
+    expected = frame[(frame['region'] == 'EU') & (frame['value'] > 0)].set_index('id')[['value']]
+    pd.testing.assert_frame_equal(data, expected)
+
+
+def test_optimize_memory_is_lossless(loader, csv_file):
+    data = loader.load_csv(csv_file, optimize_memory=True)
+    expected = pd.read_csv(csv_file)
+    assert isinstance(data['region'].dtype, pd.CategoricalDtype)
+    assert data['id'].dtype == np.int16 and data['value'].dtype == np.float64
+    pd.testing.assert_frame_equal(data.astype({'id': np.int64, 'region': expected['region'].dtype}), expected)
+
+    report = loader.memory_report
+    assert report.index.tolist() == expected.columns.tolist()
+    assert report.loc['region', 'dtype_after'] == 'category' and report.loc['id', 'dtype_after'] == 'int16'
+    assert report['bytes_after'].sum() < report['bytes_before'].sum()
+
+
+def test_load_csv_files_in_file_order(loader, tmp_path, frame):
+    for i in range(3):
+        frame.iloc[i * 1000:(i + 1) * 1000].to_csv(tmp_path / f'part{i}.csv', index=False)
+    pattern = str(tmp_path / 'part*.csv')
+    expected = pd.concat([pd.read_csv(pattern.replace('*', str(i))) for i in range(3)], ignore_index=True)
+
+    pd.testing.assert_frame_equal(loader.load_csv_files(pattern, workers=2), expected)
+    parts = list(loader.load_csv_files(pattern, workers=2, stream=True))
+    assert [len(part) for part in parts] == [1000] * 3
+
+    frame[['id']].astype(float).to_csv(tmp_path / 'part3.csv', index=False)
+    with pytest.raises(ValueError):
+        loader.load_csv_files(pattern, usecols=['id'], workers=1)
+
+
+def test_parallel_ranges_respect_quoted_newlines(loader, csv_file):
+    # small ranges make many boundaries fall inside quoted fields holding newlines
+    data = loader.load_csv(csv_file, workers=2, chunk_bytes=4096)
+    pd.testing.assert_frame_equal(data, pd.read_csv(csv_file))
+
+
+def test_parallel_compressed_blocks(loader, tmp_path, frame):
+    path = str(tmp_path / 'data.csv.gz')
+    with gzip.open(path, 'wt', newline='') as f:
+        frame.to_csv(f, index=False)
+    data = loader.load_csv(path, workers=2, chunk_bytes=4096)
+    pd.testing.assert_frame_equal(data, pd.read_csv(path))
+
+
+@pytest.mark.parametrize('suffix', ['.gz', '.bz2', '.xz'])
+def test_compressed_csv(loader, tmp_path, frame, suffix):
+    path = str(tmp_path / f'data.csv{suffix}')
+    frame.to_csv(path, index=False)
+    expected = pd.read_csv(path)
+    pd.testing.assert_frame_equal(loader.load_csv(path), expected)
+
+    chunks = list(loader.stream_csv(path, chunk_bytes=20000))
+    assert len(chunks) > 1
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+
+def test_csv_index_offsets(loader, csv_file):
+    expected = pd.read_csv(csv_file)
+    assert loader.count_rows(csv_file) == len(expected)
+
+    rows = loader.load_rows(csv_file, 1000, 1500)
+    pd.testing.assert_frame_equal(rows, expected.iloc[1000:1500])
+
+    index = CsvIndex(csv_file)  # reloaded from the sidecar file
+    assert os.path.exists(csv_file + '.idx.npz')
+    assert len(index) == len(expected)
+    begin, end = index.byte_range(0, len(index))
+    with open(csv_file, 'rb') as f:
+        assert f.readline() and f.tell() == begin
+    assert end == os.path.getsize(csv_file)
+
+
+def test_csv_index_skips_blank_lines(loader, tmp_path):
+    path = str(tmp_path / 'blank.csv')
+    with open(path, 'w', newline='') as f:
+        f.write('a,b\r\n1,2\r\n\r\n3,4\n\n"x\n\ny",5\n\n')
+    expected = pd.read_csv(path)
+    assert loader.count_rows(path) == len(expected) == 3
+    pd.testing.assert_frame_equal(loader.load_rows(path, 0, 3), expected)
+    pd.testing.assert_frame_equal(loader.sample_rows(path, 3, seed=0), expected)
+
+
+def test_sample_rows_are_file_rows(loader, csv_file):
+    sample = loader.sample_rows(csv_file, 50, seed=1)
+    expected = pd.read_csv(csv_file).loc[sample.index]
+    pd.testing.assert_frame_equal(sample, expected)
+
+
+def test_sample_csv_uniform(loader, csv_file):
+    sample = loader.sample_csv(csv_file, 100, seed=2, chunksize=400)
+    expected = pd.read_csv(csv_file).loc[sample.index]
+    assert len(sample) == 100 and sample.index.is_unique
+    pd.testing.assert_frame_equal(sample, expected)
+
+
+def test_sample_csv_stratified(loader, csv_file):
+    full = pd.read_csv(csv_file)
+    sample = loader.sample_csv(csv_file, 101, stratify_by='region', seed=3, chunksize=400)
+    quotas = DataLoader._allocate(full['region'].value_counts(), 101)
+    assert len(sample) == 101
+    assert sample['region'].value_counts().sort_index().equals(quotas[quotas > 0].sort_index())
+    pd.testing.assert_frame_equal(sample, full.loc[sample.index])
+
+
+def test_allocate_largest_remainder():
+    quotas = DataLoader._allocate(pd.Series({'a': 5, 'b': 3, 'c': 2}), 7)
+    assert quotas.to_dict() == {'a': 4, 'b': 2, 'c': 1}
+    assert DataLoader._allocate(pd.Series({'a': 2, 'b': 1}), 10).sum() == 3
+
+
+def test_where_filter_matches_query(loader, csv_file):
+    data = loader.load_csv(csv_file, where="region == 'EU' and value > 0", chunk_bytes=20000)
+    expected = pd.read_csv(csv_file).query("region == 'EU' and value > 0").reset_index(drop=True)
+    pd.testing.assert_frame_equal(data, expected)
+
+    chunks = loader.stream_csv(csv_file, chunksize=500, where=lambda chunk: chunk['id'] % 3 == 0)
+    pd.testing.assert_frame_equal(pd.concat(chunks), pd.read_csv(csv_file).iloc[::3])
+
+
+def test_mmap_store_round_trip(tmp_path):
+    data = pd.DataFrame([[1, 2.5, 'a', 3], [4, 5.5, 'b', 6]], columns=pd.MultiIndex.from_tuples(
+        [('x', 1), ('x', 2), ('y', 1), ('x', 1)], names=['top', 'sub']), index=pd.Index([10, 20], name='k'))
+    write_store(data, str(tmp_path / 'store'))
+    restored = read_store(str(tmp_path / 'store'), categorize_strings=False)
+    pd.testing.assert_frame_equal(restored.copy(), data)  # copy: the columns are np.memmap views
+    assert read_store(str(tmp_path / 'store'), usecols=[('x', 1)]).shape == (2, 2)
+
+
+def test_registry_spill_round_trip(tmp_path):
+    frames = {
+        'plain': pd.DataFrame({'s': ['a', 'b', None], 'v': [1.5, 2.0, np.nan], 'c': pd.Categorical(['x', 'y', 'x'])}),
+        'dup': pd.DataFrame([[1, 2], [3, 4]], columns=['x', 'x']),
+        'tup': pd.DataFrame([[1, 2]], columns=pd.MultiIndex.from_tuples([('a', 1), ('b', 2)])),
+        'nullable': pd.DataFrame({'n': pd.array([1, None], dtype='Int64')}),
+    }
+    registry = DatasetRegistry(memory_budget=1, spill_dir=str(tmp_path))
+    for name, data in frames.items():
+        registry.add(name, data)
+    registry.add('last', pd.DataFrame({'z': [0]}))
+    assert set(registry.spilled) == set(frames)
+
+    for name, data in frames.items():
+        pd.testing.assert_frame_equal(registry.get(name).copy(), data)
+        assert name in registry
+
+
+def test_load_csv_files_unions_categories(loader, tmp_path):
+    paths = []
+    for i, values in enumerate([['a', 'b'], ['c', 'a']]):
+        paths.append(str(tmp_path / f'm{i}.csv'))
+        pd.DataFrame({'r': values, 'v': [i, i]}).to_csv(paths[-1], index=False)
+    data = loader.load_csv_files(paths, dtype={'r': 'category'}, workers=1)
+    assert isinstance(data['r'].dtype, pd.CategoricalDtype)
+    assert data['r'].tolist() == ['a', 'b', 'c', 'a']
+
+
+def test_excel_streaming_and_parallel_sheets(loader, tmp_path, frame):
+    path = str(tmp_path / 'data.xlsx')
+    with pd.ExcelWriter(path) as writer:
+        frame.iloc[:1200].to_excel(writer, sheet_name='first', index=False)
+        frame.iloc[1200:2000].to_excel(writer, sheet_name='second', index=False)
+
+    chunks = list(loader.stream_excel(path, sheet_name='second', chunksize=300))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 200]
+    pd.testing.assert_frame_equal(pd.concat(chunks), pd.read_excel(path, sheet_name='second'))
+
+    sheets = loader.load_excel(path, sheet_name=None, workers=2)
+    expected = pd.read_excel(path, sheet_name=None)
+    assert list(sheets) == ['first', 'second']
+    for sheet in expected:
+        pd.testing.assert_frame_equal(sheets[sheet], expected[sheet])
+
+
+def test_load_excel_closes_workbook_listing_sheets(loader, tmp_path, monkeypatch):
+    path = str(tmp_path / 'data.xlsx')
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({'a': [1, 2]}).to_excel(writer, sheet_name='first', index=False)
+        pd.DataFrame({'a': [3]}).to_excel(writer, sheet_name='second', index=False)
+
+    closed = []
+
+    class ExcelFile(pd.ExcelFile):
+        def close(self):
+            closed.append(self)
+            super().close()
+
+    monkeypatch.setattr(pd, 'ExcelFile', ExcelFile)
+    assert list(loader.load_excel(path, sheet_name=None, workers=2)) == ['first', 'second']
+    assert len(closed) == 1
+
+
+def test_async_loader_loads_concurrently(tmp_path, frame):
+    paths = []
+    for i in range(3):
+        paths.append(str(tmp_path / f'part{i}.csv'))
+        frame.iloc[i * 1000:(i + 1) * 1000].to_csv(paths[-1], index=False)
+
+    async def load():
+        async with AsyncDataLoader(max_workers=2) as async_loader:
+            task = async_loader.prefetch(paths[0])
+            parts = await async_loader.load_many(paths)
+            await async_loader.load_csv(paths[2], name='last')
+            return await task, parts, async_loader.loader.get_data('last')
+
+    first, parts, last = asyncio.run(load())
+    expected = [pd.read_csv(path) for path in paths]
+    pd.testing.assert_frame_equal(first, expected[0])
+    for part, data in zip(parts, expected):
+        pd.testing.assert_frame_equal(part, data)
+    pd.testing.assert_frame_equal(last, expected[2])
+
+
+def test_async_loader_leaves_given_executor_running(csv_file):
+    async def load(executor):
+        async with AsyncDataLoader(executor=executor) as async_loader:
+            return await async_loader.load_csv(csv_file)
+
+    with ThreadPoolExecutor(1) as executor:
+        pd.testing.assert_frame_equal(asyncio.run(load(executor)), pd.read_csv(csv_file))
+        assert executor.submit(len, 'abc').result() == 3
+
+
+def test_prefetch_matches_stream(loader, csv_file):
+    chunks = loader.stream_csv(csv_file, chunksize=700, prefetch=2)
+    pd.testing.assert_frame_equal(pd.concat(list(chunks)), pd.read_csv(csv_file))
+    assert chunks.chunks == 5
+
+
+def test_prefetch_thread_ends_after_break(loader, csv_file):
+    before = threading.active_count()
+    for _ in loader.stream_csv(csv_file, chunksize=100, prefetch=2):
+        break
+    gc.collect()
+    time.sleep(0.3)
+    assert threading.active_count() == before
+
+
+@pytest.fixture
+def partitions(tmp_path, frame):
+    frame = frame.drop(columns='note')
+    frame['when'] = pd.date_range('2024-01-03', periods=len(frame), freq='h').strftime('%Y-%m-%d %H:%M')
+    paths = [str(tmp_path / 'p1.csv'), str(tmp_path / 'p2.csv')]
+    frame.iloc[:1500].to_csv(paths[0], index=False)
+    frame.iloc[1500:].to_csv(paths[1], index=False)
+    return paths
+
+
+def test_schema_inferred_once_per_layout(loader, partitions):
+    schema = loader.infer_schema(partitions[0])
+    assert schema['categories'] == ['region']
+    assert schema['parse_dates'] == ['when'] and schema['date_formats'] == {'when': '%Y-%m-%d %H:%M'}
+    assert loader.infer_schema(partitions[1]) is schema  # same header, same schema
+
+    data = loader.load_csv(partitions[1], schema='auto')
+    expected = pd.read_csv(partitions[1], dtype={'id': 'Int64', 'region': 'category'}, parse_dates=['when'],
+                           date_format='%Y-%m-%d %H:%M')
+    pd.testing.assert_frame_equal(data, expected)
+    pd.testing.assert_frame_equal(pd.concat(loader.stream_csv(partitions[1], chunksize=400, schema=schema)), expected)
+
+
+def test_schema_allows_na_after_sample(loader, tmp_path):
+    data = pd.DataFrame({'x': np.arange(12000), 'flag': np.arange(12000) % 2 == 0})
+    data = data.astype({'x': 'Int64', 'flag': 'boolean'})
+    data.loc[11500, ['x', 'flag']] = pd.NA  # past the 10,000 sampled rows
+    paths = [str(tmp_path / 'p1.csv'), str(tmp_path / 'p2.csv')]
+    data.iloc[:11000].to_csv(paths[0], index=False)
+    data.to_csv(paths[1], index=False)
+
+    assert loader.infer_schema(paths[0])['dtype'] == {'x': 'Int64', 'flag': 'boolean'}
+    pd.testing.assert_frame_equal(loader.load_csv(paths[0], schema='auto'), data.iloc[:11000])
+    pd.testing.assert_frame_equal(loader.load_csv(paths[1], schema='auto'), data)
+
+
+def test_schema_key_covers_wide_headers(loader, tmp_path):
+    shared = [f'feature_{i:05d}' for i in range(6000)]  # a header longer than the 64 KB read at once
+    paths = []
+    for last, value in (('count', 1), ('label', 'a')):
+        paths.append(str(tmp_path / f'{last}.csv'))
+        pd.DataFrame([[0] * len(shared) + [value]], columns=shared + [last]).to_csv(paths[-1], index=False)
+
+    first, second = loader.infer_schema(paths[0]), loader.infer_schema(paths[1])
+    assert first['columns'][-1] == 'count' and second['columns'][-1] == 'label'
+    assert len(loader.schemas) == 2
+
+
+def test_missing_file_raises_runtime_error(loader, tmp_path):
+    path = str(tmp_path / 'missing.csv')
+    for call in (lambda: loader.load_csv(path, schema='auto'), lambda: loader.load_csv(path, parse_dates=['day']),
+                 lambda: loader.infer_schema(path), lambda: loader.detect_date_formats(path, ['day']),
+                 lambda: loader.load_csv_files([path], parse_dates=['day'])):
+        with pytest.raises(RuntimeError, match='Error loading CSV'):
+            call()
+
+
+def test_date_formats_detected_once(loader, tmp_path):
+    path = str(tmp_path / 'dates.csv')
+    days = pd.date_range('2024-01-05', periods=60, freq='D')  # day first, and only past the 12th unambiguous
+    pd.DataFrame({'day': days.strftime('%d/%m/%Y'), 'v': range(60)}).to_csv(path, index=False)
+
+    assert loader.detect_date_formats(path, ['day', 'v']) == {'day': '%d/%m/%Y'}
+    assert set(loader.date_formats.values()) == {'%d/%m/%Y', None}
+
+    data = loader.load_csv(path, parse_dates=['day'])
+    assert data['day'].tolist() == days.tolist()
+    chunks = loader.stream_csv(path, chunksize=7, parse_dates=['day'])
+    pd.testing.assert_frame_equal(pd.concat(chunks), data)
+
+
+def test_load_jsonl_matches_read_json(loader, tmp_path, frame):
+    path = str(tmp_path / 'data.jsonl')
+    frame.to_json(path, orient='records', lines=True)
+    data = loader.load_jsonl(path, usecols=['id', 'value'], chunksize=500, where='value > 0')
+    expected = pd.read_json(path, lines=True)
+    expected = expected[expected['value'] > 0][['id', 'value']]
+    pd.testing.assert_frame_equal(data, expected)
+
+    with pytest.raises(RuntimeError, match='Error loading JSON Lines'):
+        loader.stream_jsonl(str(tmp_path / 'missing.jsonl'))
+
+
+def test_stream_sql_matches_read_sql(loader, tmp_path, frame):
+    path = str(tmp_path / 'data.db')
+    with sqlite3.connect(path) as con:
+        frame.to_sql('data', con, index=False)
+    query = "select id, region, value from data where region = ?"
+    chunks = list(loader.stream_sql(path, query, params=['EU'], chunksize=250))
+    with sqlite3.connect(path) as con:
+        expected = pd.read_sql_query(query, con, params=['EU'])
+    assert max(len(chunk) for chunk in chunks) == 250
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+
+def test_load_sql_matches_read_sql(loader, tmp_path, frame):
+    path = str(tmp_path / 'data.db')
+    with sqlite3.connect(path) as con:
+        frame.to_sql('data', con, index=False)
+    query = "select id, region, value from data where region = ?"
+    data = loader.load_sql(path, query, params=['EU'], chunksize=250)
+    with sqlite3.connect(path) as con:
+        expected = pd.read_sql_query(query, con, params=['EU'])
+    pd.testing.assert_frame_equal(data, expected)
+
+    data = loader.load_sql(path, "select region, value from data", chunksize=250, optimize_memory=True)
+    assert isinstance(data['region'].dtype, pd.CategoricalDtype)
+    assert loader.memory_report.loc['region', 'dtype_after'] == 'category'
+    assert data['region'].astype(str).tolist() == frame['region'].tolist()
+
+
+def test_load_sparse_csv_matches_dense(loader, tmp_path):
+    pytest.importorskip('scipy')
+    rng = np.random.default_rng(4)
+    dense = (rng.random((500, 60)) < 0.05) * rng.integers(1, 9, (500, 60))
+    path = str(tmp_path / 'sparse.csv')
+    pd.DataFrame(dense, columns=[f'f{i}' for i in range(60)]).to_csv(path, index=False)
+
+    matrix = loader.load_sparse_csv(path, chunksize=128)
+    assert matrix.format == 'csr' and matrix.nnz == np.count_nonzero(dense)
+    np.testing.assert_array_equal(matrix.toarray(), dense)
+
+    data = loader.load_sparse_csv(path, format='pandas')
+    np.testing.assert_array_equal(data.sparse.to_dense().to_numpy(), dense)
+
+
+def test_registry_keeps_dataset_when_reload_fails(tmp_path):
+    registry = DatasetRegistry(memory_budget=1, spill_dir=str(tmp_path))
+    registry.add('a', pd.DataFrame({'v': [1.0, 2.0]}))
+    registry.add('b', pd.DataFrame({'v': [3.0]}))
+    path = registry.spilled['a']
+    manifest = os.path.join(path, 'columns.json')
+    os.rename(manifest, manifest + '.bak')
+    with pytest.raises(FileNotFoundError):
+        registry.get('a')
+    assert 'a' in registry
+
+    os.rename(manifest + '.bak', manifest)
+    assert registry.get('a')['v'].tolist() == [1.0, 2.0]
@@ -0,0 +1,187 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.stats as stats
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import hypothesis_testing
+from src.streaming_tests import StreamingTests
+from src.summary_stats import ContingencyTable, CorrelationStats, RunningStats
+
+TestHypothesis = hypothesis_testing.TestHypothesis
+TestHypothesis.__test__ = False  # a library class, not a pytest test class
+
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(3)
+    return rng.normal(0, 1, 300), rng.normal(0.2, 1.5, 250), rng.normal(0, 1, 280)
+
+
+@pytest.fixture
+def tester():
+    return TestHypothesis(quiet=True)
+
+
+def test_batch_one_sample_ttest_matches_scipy(tester):
+    data = pd.DataFrame(np.random.default_rng(0).normal(0, 1, (200, 50)))
+    data.iloc[3, 5] = np.nan
+    rejected, p_values, statistics = tester.batchOneSampleTtest(data, 0.05)
+    expected = stats.ttest_1samp(data, 0.05, nan_policy='omit')
+    np.testing.assert_allclose(statistics, expected.statistic)
+    np.testing.assert_allclose(p_values, expected.pvalue)
+    np.testing.assert_array_equal(rejected, expected.pvalue < 0.05)
+
+
+def test_batch_two_sample_ttest_matches_scipy(tester):
+    rng = np.random.default_rng(1)
+    data1 = pd.DataFrame(rng.normal(0, 1, (120, 40)))
+    data2 = pd.DataFrame(rng.normal(0.1, rng.uniform(0.5, 2, 40), (90, 40)))
+    _, p_values, statistics = tester.batchTwoSampleTtest(data1, data2)
+
+    for col in data1:
+        equal_var = stats.levene(data1[col], data2[col]).pvalue > 0.05
+        expected = stats.ttest_ind(data1[col], data2[col], equal_var=equal_var)
+        assert statistics[col] == pytest.approx(expected.statistic)
+        assert p_values[col] == pytest.approx(expected.pvalue)
+
+    _, p_values, _ = tester.batchTwoSampleTtest(data1, data2, equal_var=False)
+    np.testing.assert_allclose(p_values, stats.ttest_ind(data1, data2, equal_var=False).pvalue)
+
+
+def test_is_normal_is_cached(samples):
+    tester = TestHypothesis(cache_size=2)
+    a, b, c = samples
+    result = tester.isNormal(a)
+    assert tester.isNormal(a.copy()) == result and tester.cache_hits == 1
+    tester.isNormal(b)
+    tester.isNormal(c)
+    assert len(tester.assumption_cache) == 2 and tester.cache_misses == 3
+    tester.significance_level = 0.01
+    tester.isNormal(c)
+    assert tester.cache_misses == 4
+
+
+def test_is_normal_of_timedelta_sample(samples):
+    tester = TestHypothesis()
+    durations = (samples[0] * 60 + 600).astype('timedelta64[s]')
+    expected = stats.shapiro(durations).pvalue > tester.significance_level
+    assert tester.isNormal(durations) == expected
+    assert tester.isNormal(durations.copy()) == expected and tester.cache_hits == 1
+
+
+def test_quiet_results_table(tester, samples):
+    a, b, _ = samples
+    result = tester.twoSampleTtest(a[:250], b)
+    expected = stats.ttest_ind(a[:250], b, equal_var=result.assumptions['equal_var'])
+    assert result.p_value == pytest.approx(expected.pvalue) and result.n == 500
+    tester.batchOneSampleTtest(np.c_[a[:250], b], 0)
+
+    frame = tester.results.toFrame()
+    assert frame['test'].tolist() == ['two sample t-test'] + ['one sample t-test'] * 2
+    assert frame['equal_var'].isna().tolist() == [False, True, True]
+
+    quiet = TestHypothesis(quiet=True, collect_results=False)
+    quiet.OneSampleTtest(a, 0)
+    assert len(quiet.results) == 0
+
+
+def test_running_stats_merge(samples):
+    a, _, _ = samples
+    chunked = RunningStats()
+    for chunk in np.array_split(a, 7):
+        chunked.update(chunk)
+    merged = RunningStats.from_values(a[:100]) + RunningStats.from_values(a[100:])
+    for accumulator in (chunked, merged):
+        n, mean, var = accumulator.summary()
+        assert n == len(a)
+        assert mean == pytest.approx(a.mean())
+        assert var == pytest.approx(a.var(ddof=1))
+
+    columns = RunningStats.from_values(np.c_[a, a * 2])
+    np.testing.assert_allclose(columns.var, [a.var(ddof=1), (a * 2).var(ddof=1)])
+
+
+def test_summary_tests_match_scipy(tester, samples):
+    a, b, c = samples
+    summary = RunningStats.from_values(a)
+
+    assert tester.OneSampleTtest(summary, 0.1).p_value == pytest.approx(stats.ttest_1samp(a, 0.1).pvalue)
+
+    equal_var = stats.bartlett(a, b).pvalue > 0.05
+    result = tester.twoSampleTtest(summary, RunningStats.from_values(b))
+    assert result.p_value == pytest.approx(stats.ttest_ind(a, b, equal_var=equal_var).pvalue)
+
+    differences = RunningStats.from_values(a[:250] - b)
+    assert tester.pairedTtest(differences).p_value == pytest.approx(stats.ttest_rel(a[:250], b).pvalue)
+
+    result = tester.ANOVA(summary, b, RunningStats.from_values(c))
+    expected = stats.f_oneway(a, b, c)
+    assert result.statistic == pytest.approx(expected.statistic)
+    assert result.p_value == pytest.approx(expected.pvalue)
+    assert result.assumptions['equal_var'] == (stats.bartlett(a, b, c).pvalue > 0.05)
+
+
+def test_chi_square_and_correlation_from_accumulators(tester):
+    rng = np.random.default_rng(5)
+    x, y = rng.choice(['a', 'b', 'c'], 2000), rng.choice(['p', 'q'], 2000)
+    table = ContingencyTable()
+    for part in np.array_split(np.arange(2000), 4):
+        table.update(x[part], y[part])
+    assert tester.chiSquare(table).p_value == pytest.approx(stats.chi2_contingency(pd.crosstab(x, y))[1])
+
+    u = rng.normal(0, 1, 2000)
+    v = u * 0.1 + rng.normal(0, 1, 2000)
+    correlation = CorrelationStats().update(u[:700], v[:700]).merge(CorrelationStats().update(u[700:], v[700:]))
+    expected = stats.pearsonr(u, v)
+    result = tester.pearsonCorrelation(correlation)
+    assert result.statistic == pytest.approx(expected.statistic)
+    assert result.p_value == pytest.approx(expected.pvalue)
+
+
+def test_streaming_tests_match_scipy(tmp_path):
+    rng = np.random.default_rng(1)
+    n = 20000
+    data = pd.DataFrame({
+        'variant': rng.choice(['A', 'B', 'C'], n),
+        'converted': rng.choice(['y', 'n'], n, p=[0.1, 0.9]),
+        'revenue': rng.normal(10, 3, n),
+        'before': rng.normal(5, 1, n),
+    })
+    data['after'] = data['before'] + rng.normal(0.01, 0.5, n)
+    data.loc[5, 'revenue'] = np.nan
+    path = str(tmp_path / 'experiment.csv')
+    data.to_csv(path, index=False)
+
+    def declare(runner):
+        return (runner.OneSampleTtest('revenue', 10)
+                .twoSampleTtest('revenue', by='variant', groups=('A', 'B'))
+                .pairedTtest('before', 'after')
+                .ANOVA('revenue', by='variant')
+                .chiSquare('variant', 'converted')
+                .pearsonCorrelation('before', 'after'))
+
+    results = declare(StreamingTests(TestHypothesis(quiet=True))).run(pd.read_csv(path, chunksize=3000))
+
+    valid = data.dropna(subset=['revenue'])
+    groups = [valid.loc[valid['variant'] == g, 'revenue'] for g in 'ABC']
+    equal_var = stats.bartlett(groups[0], groups[1]).pvalue > 0.05
+    expected = [
+        stats.ttest_1samp(valid['revenue'], 10).pvalue,
+        stats.ttest_ind(groups[0], groups[1], equal_var=equal_var).pvalue,
+        stats.ttest_rel(data['before'], data['after']).pvalue,
+        stats.f_oneway(*groups).pvalue,
+        stats.chi2_contingency(pd.crosstab(data['variant'], data['converted']))[1],
+        stats.pearsonr(data['before'], data['after']).pvalue,
+    ]
+    assert [r.p_value for r in results] == pytest.approx(expected)
+
+    chunks = list(pd.read_csv(path, chunksize=3000))
+    first, second = declare(StreamingTests(TestHypothesis(quiet=True))), declare(StreamingTests(TestHypothesis(quiet=True)))
+    first.run(chunks[:3])
+    second.run(chunks[3:])
+    assert [r.p_value for r in first.merge(second).results()] == pytest.approx(expected)